@@ -1,6 +1,6 @@
 import pygame as py
 import os
-from support import surface_blit, load_image, load_font, draw_ui_sprite
+from support import surface_blit, load_image, load_font, get_font, render_text, draw_ui_sprite
 from settings import *
 
 class MyStatsPopup:
@@ -8,13 +8,13 @@ class MyStatsPopup:
         """Initialize all asset sprites"""
         try:
             # Load digit sprites (0-9)
-            base_path = "assets/ui_ux/settings/number"
+            base_path = mystats_number_path
             self.digits = {}
             for n in range(10):
                 self.digits[n] = load_image(os.path.join(base_path, f"{n}.png"))
             
             # Load text sprites
-            text_path = "assets/ui_ux/settings/text"
+            text_path = mystats_text_path
             self.text_sprites = {
                 'highest': load_image(os.path.join(text_path, "highest.png")),
                 'level': load_image(os.path.join(text_path, "level.png")),
@@ -27,22 +27,24 @@ class MyStatsPopup:
             print(f"Warning: Could not load MyStatsPopup assets: {e}. Using fallbacks.")
             
             # Create fallback digits
-            font = py.font.Font(None, 48)
+            font = get_font(None, 48)
             self.digits = {}
             for n in range(10):
-                surf = font.render(str(n), True, WHITE)
+                surf = render_text(font, str(n), WHITE)
                 self.digits[n] = surf
             
             # Create fallback text
-            text_font = py.font.Font(None, 36)
+            text_font = get_font(None, 36)
             self.text_sprites = {
-                'highest': text_font.render("HIGHEST", True, WHITE),
-                'level': text_font.render("LEVEL", True, WHITE),
-                'annihilated': text_font.render("ANNIHILATED", True, WHITE)
+                'highest': render_text(text_font, "HIGHEST", WHITE),
+                'level': render_text(text_font, "LEVEL", WHITE),
+                'annihilated': render_text(text_font, "ANNIHILATED", WHITE)
             }
 
-    def __init__(self):
+    def __init__(self, store=None):
+        # store, a stats_store.StatsStore, keeps the stats between runs
         self.display_surface = py.display.get_surface()
+        self.store = store
         
         # Load background sprite
         try:
@@ -64,6 +66,11 @@ class MyStatsPopup:
         )
 
         self.is_active = False
+
+        # Area covered by the tab background while the popup is open
+        self.draw_rect = py.Rect(0, 0, self.display_surface.get_width() // 2 + 75,
+                                 self.display_surface.get_height() // 2 + 200)
+        self.draw_rect.center = self.display_surface.get_rect().center
         
         # Load font
         self.font = load_font(FONT, FONT_SIZE)
@@ -71,6 +78,9 @@ class MyStatsPopup:
         # Stats data
         self.highest_level = 1  # Start at 1 instead of 0
         self.annihilated = 0
+        if store is not None:
+            self.highest_level = store.highest_level
+            self.annihilated = store.annihilated
         
         # Initialize assets
         self.digits = {}
@@ -88,9 +98,17 @@ class MyStatsPopup:
             
         # Keep track of total enemies annihilated across all stages
         self.annihilated += new_annihilated
+
+        if self.store is not None:
+            self.store.record(self.highest_level, new_annihilated)
         
         print(f"Stats updated: Level {self.highest_level}, Annihilated {self.annihilated}")
 
+    def close(self):
+        """Save anything not written yet; call once when the game quits."""
+        if self.store is not None:
+            self.store.close()
+
     def toggle(self):
         """Toggle popup visibility"""
         self.is_active = not self.is_active
@@ -189,9 +207,9 @@ class MyStatsPopup:
             return
             
         if hasattr(self, 'font') and self.font:
-            font = self.font.get('small', py.font.Font(None, 24))
+            font = self.font.get('small') or get_font(None, 24)
             debug_text = f"Level: {self.highest_level}, Killed: {self.annihilated}"
-            debug_surface = font.render(debug_text, True, WHITE)
+            debug_surface = render_text(font, debug_text, WHITE)
             debug_rect = debug_surface.get_rect()
             debug_rect.bottomright = (self.display_surface.get_width() - 10, 
                                     self.display_surface.get_height() - 10)
@@ -206,4 +224,6 @@ class MyStatsPopup:
             self.draw_highest_level()
             self.draw_annihilated()
             # Uncomment if you want debug info displayed
-            # self.draw_debug_info()
\ No newline at end of file
+            # self.draw_debug_info()
+            return self.draw_rect
+        return None
\ No newline at end of file
@@ -1,4 +1,6 @@
 import pygame, math
+from settings import SPEED_FRAME_RATE
+from transform_cache import rotated, quantize_angle
 
 class AnimatedSprite(pygame.sprite.Sprite):
     def __init__(self, frames, x, y, speed=0):
@@ -12,26 +14,47 @@ class AnimatedSprite(pygame.sprite.Sprite):
         else:
             self.image = self.frames[self.frame_index]
         self.rect = self.image.get_rect(center=(x, y))
-        self.speed = speed
+        # Float position of the centre; rect follows it rounded. prev_pos is
+        # the position one simulation step ago, for render interpolation.
+        self.pos = pygame.Vector2(x, y)
+        self.prev_pos = pygame.Vector2(x, y)
+        self.speed = speed  # pixels per frame at SPEED_FRAME_RATE
         self.animation_timer = 0
         self.animation_speed = 100
         self.rotation = 0
 
+    def set_position(self, center):
+        self.pos.update(center)
+        self.prev_pos.update(center)
+        self.rect.center = (round(self.pos.x), round(self.pos.y))
+
+    def move(self, dx, dy):
+        self.pos.x += dx
+        self.pos.y += dy
+        self.rect.center = (round(self.pos.x), round(self.pos.y))
+
+    def interpolate(self, alpha):
+        """Place rect between the last two simulation steps for drawing."""
+        x = self.prev_pos.x + (self.pos.x - self.prev_pos.x) * alpha
+        y = self.prev_pos.y + (self.pos.y - self.prev_pos.y) * alpha
+        self.rect.center = (round(x), round(y))
+
     def update(self, dt):
-        if self.speed != 0:
-            self.rect.y += self.speed
+        self.prev_pos.update(self.pos)
+        # Also undoes any interpolation left on rect by the last render
+        self.move(0, self.speed * SPEED_FRAME_RATE * dt / 1000)
 
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
             if self.frames:
                 self.frame_index = (self.frame_index + 1) % len(self.frames)
-                self.image = self.original_frames[self.frame_index]
-                self.image = pygame.transform.rotate(self.image, self.rotation)
+                self.image = rotated(self.original_frames[self.frame_index], self.rotation)
                 self.rect = self.image.get_rect(center=self.rect.center)
     
     def rotate_to(self, target_pos):
         dx = target_pos[0] - self.rect.centerx
         dy = target_pos[1] - self.rect.centery
         angle = math.degrees(math.atan2(-dy, dx)) - 90
-        self.rotation = angle
\ No newline at end of file
+        # Snap to the angles the shared rotation cache holds
+        self.rotation = quantize_angle(angle)
\ No newline at end of file
@@ -0,0 +1,82 @@
+from bisect import insort, bisect_left
+from itertools import count
+
+from settings import SPEED_FRAME_RATE
+
+
+class AnswerIndex:
+    """
+    Live enemies by answer, each kept in order of height on screen.
+
+    Enemies only fall, at a constant speed, so among enemies of the same
+    speed the order by y never changes. Each one is filed under its
+    intercept, the y it would have had at clock 0, in a sorted lane per
+    speed; lanes hold (intercept, sequence, enemy) so ties never compare
+    enemies. advance() must be given the same dt as the enemies' update().
+
+    lowest(answer) and the loss-line check then only look at the bottom of
+    each lane instead of scanning every enemy.
+    """
+    def __init__(self):
+        self.clock = 0.0
+        self.answers = {}       # answer -> {speed: lane}
+        self.lanes = {}         # speed -> lane of every enemy
+        self.entries = {}       # enemy -> (speed, entry)
+        self.sequence = count()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, enemy):
+        return enemy in self.entries
+
+    def advance(self, dt):
+        self.clock += dt
+
+    def add(self, enemy):
+        speed = enemy.speed
+        intercept = enemy.pos.y - speed * SPEED_FRAME_RATE * self.clock / 1000
+        entry = (intercept, next(self.sequence), enemy)
+        self.entries[enemy] = (speed, entry)
+        insort(self.lanes.setdefault(speed, []), entry)
+        insort(self.answers.setdefault(enemy.answer, {}).setdefault(speed, []), entry)
+
+    def _discard(self, lanes, speed, entry):
+        lane = lanes[speed]
+        del lane[bisect_left(lane, entry[:2])]
+        if not lane:
+            del lanes[speed]
+
+    def remove(self, enemy):
+        """Forget an enemy that was killed or left the screen; unknown enemies are ignored."""
+        speed, entry = self.entries.pop(enemy, (None, None))
+        if entry is None:
+            return
+        self._discard(self.lanes, speed, entry)
+        answer_lanes = self.answers[enemy.answer]
+        self._discard(answer_lanes, speed, entry)
+        if not answer_lanes:
+            del self.answers[enemy.answer]
+
+    def clear(self):
+        self.answers.clear()
+        self.lanes.clear()
+        self.entries.clear()
+
+    def lowest(self, answer=None):
+        """The enemy closest to the bottom with answer (any answer if None), or None."""
+        lanes = self.lanes if answer is None else self.answers.get(answer)
+        if not lanes:
+            return None
+        return max((lane[-1][2] for lane in lanes.values()), key=lambda enemy: enemy.pos.y)
+
+    def crossed(self, bottom):
+        """Every enemy whose rect reaches down to bottom or further."""
+        result = []
+        for lane in self.lanes.values():
+            for i in range(len(lane) - 1, -1, -1):
+                enemy = lane[i][2]
+                if enemy.rect.bottom < bottom:
+                    break
+                result.append(enemy)
+        return result
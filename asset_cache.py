@@ -0,0 +1,124 @@
+import pygame, os, sys, mmap, struct
+
+from settings import *
+from blob_store import BlobStore, open_from_args
+
+# Blob layout: header followed by width * height BGRA pixels.
+HEADER = struct.Struct("<4sIII")
+MAGIC = b"AMC1"
+FLAG_OPAQUE = 1
+
+
+def _alpha_format():
+    """Pixel masks of a convert_alpha() surface on the current display."""
+    probe = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    return probe.get_bitsize(), probe.get_masks()
+
+
+class AssetCache(BlobStore):
+    """
+    Directory of pre-converted, pre-scaled pixel blobs.
+
+    Each blob is keyed by the source path, its mtime and file size, the
+    target size, the alpha mode and the display pixel format, so editing an
+    image or changing display simply misses the cache. Hits are memory-mapped
+    and wrapped with pygame.image.frombuffer without copying the pixels.
+    """
+    kind = "asset cache"
+    extension = ".bgra"
+
+    def __init__(self, directory=ASSET_CACHE_DIR):
+        super().__init__(directory)
+        self.format = None
+
+    def _pixel_format(self):
+        if self.format is None:
+            self.format = _alpha_format()
+        return self.format
+
+    def blob_path(self, path, size=None, alpha=True):
+        return self._blob_path(path, size, alpha, self._pixel_format())
+
+    def get(self, path, size=None, alpha=True, convert=True):
+        """
+        Returns the cached surface, or None on a miss. With convert=False it
+        is returned as stored, 32-bit BGRA, without touching the display.
+        """
+        blob = self._find(path, size, alpha)
+        if blob is None:
+            return None
+
+        try:
+            with open(blob, "rb") as f:
+                # ACCESS_COPY shares the page cache for reads but keeps any
+                # write to the surface private, so a blit into a cached
+                # surface can never corrupt the file or crash on a
+                # read-only mapping.
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            magic, width, height, flags = HEADER.unpack_from(mapping)
+            if magic != MAGIC or len(mapping) != HEADER.size + width * height * 4:
+                raise ValueError("truncated or foreign blob")
+        except (OSError, ValueError, struct.error):
+            self.misses += 1
+            return None
+
+        # The surface holds the memoryview and through it the mapping, which
+        # is unmapped once the last surface using it is freed.
+        pixels = memoryview(mapping)[HEADER.size:]
+        surface = pygame.image.frombuffer(pixels, (width, height), "BGRA")
+        if convert and flags & FLAG_OPAQUE:
+            # Opaque images use the display's alpha-less format, which
+            # frombuffer cannot describe, so these pay for one conversion.
+            surface = surface.convert()
+        elif convert and (surface.get_bitsize(), surface.get_masks()) != self._pixel_format():
+            surface = surface.convert_alpha()
+
+        self._hit(blob)
+        return surface
+
+    def put(self, path, size, alpha, surface):
+        """Store a converted surface."""
+        blob = self.blob_path(path, size, alpha)
+        if blob is None:
+            return
+
+        flags = 0 if surface.get_flags() & pygame.SRCALPHA else FLAG_OPAQUE
+        width, height = surface.get_size()
+        self._write(blob, HEADER.pack(MAGIC, width, height, flags), pygame.image.tobytes(surface, "BGRA"))
+
+
+def main(argv=None):
+    """Pre-warm the cache, e.g. at install time: python asset_cache.py"""
+    cache = open_from_args(AssetCache, "Build the ArithMetron asset cache.", ASSET_CACHE_DIR, argv)
+    if cache is None:
+        return 0
+
+    # The key includes the display pixel format, so warm against the real
+    # video driver when there is one.
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    except pygame.error:
+        pygame.display.quit()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    import asset_loader
+    loader = asset_loader.AssetLoader(cache=cache)
+    loader.load_all()
+    if asset_loader.BACKGROUND_STREAMING:
+        # Outside every manifest, but StreamingBackground reads them from the cache
+        streamed = asset_loader.AssetLoader(asset_loader.streamed_manifest(), cache=cache)
+        streamed.load_all()
+        print(streamed.report()[0])
+    removed = asset_loader.retire_stale(cache)
+
+    print(loader.report()[0])
+    print(f"{cache.hits} already cached, {cache.misses} rebuilt, {removed} stale removed in {cache.directory}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+import pygame, os, time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from settings import *
+import frame_codec
+
+# Surfaces decoded by preload(), keyed by (normalised path, target size).
+_preloaded = {}
+
+
+def asset_key(path, size=None):
+    return (os.path.normpath(path), tuple(size) if size else None)
+
+
+def _folder_images(folder):
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                  if name.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif")))
+
+
+def streamed_manifest():
+    """In-game background frames; left to StreamingBackground when BACKGROUND_STREAMING is on."""
+    return [(os.path.join(GAME_BACKGROUND_PATH, f"{i}.png"), SCREEN_SIZE, True)
+            for i in range(1, GAME_BACKGROUND_FRAMES + 1)]
+
+
+def background_encoded():
+    return os.path.exists(os.path.join(GAME_BACKGROUND_ENCODED_PATH, frame_codec.INDEX_FILE))
+
+
+def menu_manifest():
+    """
+    Images the menu needs for its first frame, as (path, size, alpha) entries.
+
+    size is the size handed to pygame.transform.scale (None keeps the source
+    size). alpha=True always converts with convert_alpha(), alpha=False with
+    convert(); alpha=None mirrors support.load_image and only keeps per-pixel
+    alpha when the source has it.
+    """
+    manifest = []
+
+    # AnimatedBackground frames, scaled to the screen
+    for i in range(1, MENU_BACKGROUND_FRAMES + 1):
+        manifest.append((os.path.join(MENU_BACKGROUND_PATH, f"{i}.png"), SCREEN_SIZE, True))
+
+    # load_frames: the menu's spaceship
+    for filename in player_filenames:
+        manifest.append((filename, SPRITE_SIZE, True))
+
+    # load_button_images / load_static_button
+    for state in ("idle", "hover", "pressed"):
+        manifest.append((os.path.join(play_button_path, f"{state}.png"), PLAY_BUTTON_SIZE, True))
+    manifest.append((settings_filename, SETTINGS_BUTTON_SIZE, True))
+    manifest.append((my_stats_filename, MY_STATS_BUTTON_SIZE, True))
+    manifest.append((quit_filename, QUIT_BUTTON_SIZE, True))
+
+    # support.load_image: title, SettingsPopup and MyStatsPopup sprites
+    unscaled = [game_title_sprite,
+                settings_background,
+                settings_settings_text,
+                settings_music_text,
+                settings_sounds_text,
+                settings_bar_sprite,
+                settings_knob_sprite]
+    unscaled += [os.path.join(mystats_number_path, f"{n}.png") for n in range(10)]
+    unscaled += [os.path.join(mystats_text_path, f"{name}.png") for name in ("highest", "level", "annihilated")]
+    for path in unscaled:
+        manifest.append((path, None, None))
+
+    return manifest
+
+
+def game_manifest():
+    """Images only the game scene uses, loaded behind the menu; same entries as menu_manifest()."""
+    manifest = []
+
+    if BACKGROUND_STREAMING:
+        pass    # StreamingBackground decodes its own frames
+    elif background_encoded():
+        # DeltaBackground: opaque keyframe and tile atlas instead of the frames
+        for filename in (frame_codec.KEYFRAME_FILE, frame_codec.ATLAS_FILE):
+            manifest.append((os.path.join(GAME_BACKGROUND_ENCODED_PATH, filename), None, False))
+    else:
+        manifest += streamed_manifest()
+
+    for filename in enemy_filenames + explosion_filenames + laser_filenames:
+        manifest.append((filename, SPRITE_SIZE, True))
+
+    # support.load_image: UI sprites
+    unscaled = ['assets/ui_ux/level/stage.png',
+                'assets/ui_ux/level/dash.png']
+    unscaled += _folder_images('assets/ui_ux/level/numbers/')
+    unscaled += _folder_images('assets/ui_ux/health_bar/')
+    for path in unscaled:
+        manifest.append((path, None, None))
+
+    return manifest
+
+
+def build_manifest():
+    """Every image the game loads, menu first."""
+    return menu_manifest() + game_manifest()
+
+
+def _decode(path, size):
+    """
+    Decode and scale one image off the main thread.
+
+    Runs in a worker thread or process, so it must not touch the display:
+    the pixels are handed back as raw bytes and converted by the caller.
+    """
+    start = time.perf_counter()
+    image = pygame.image.load(path)
+    has_alpha = bool(image.get_alpha())
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    data = pygame.image.tobytes(image, "RGBA" if has_alpha else "RGB")
+    return data, image.get_size(), has_alpha, time.perf_counter() - start
+
+
+class AssetLoader:
+    """
+    Decodes a manifest in a worker pool and converts the results on the
+    calling thread, which owns the display.
+
+    load_all() does it in one go. For loading behind running frames, call
+    start() once and then poll() every frame: it converts whatever the pool
+    has finished within a time budget and never waits for a decode.
+    With publish, every surface is registered for get() as soon as it is
+    ready.
+    """
+    def __init__(self, manifest=None, workers=None, use_processes=False, cache=None, publish=False):
+        self.manifest = build_manifest() if manifest is None else manifest
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.cache = cache
+        self.publish = publish
+
+        self.surfaces = {}
+        self.timings = {}   # key -> (decode seconds, convert seconds)
+        self.cached = set()
+        self.errors = {}
+        self.total_time = 0
+        self.total = 0
+        self.done = False
+        self.blocking = True
+        self._steps = None
+
+    def _wrap(self, data, size, has_alpha, alpha):
+        """Wrap decoded bytes in a surface and convert it to the display format."""
+        surface = pygame.image.frombuffer(data, size, "RGBA" if has_alpha else "RGB")
+        if alpha or (alpha is None and has_alpha):
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def _store(self, key, surface):
+        self.surfaces[key] = surface
+        if self.publish:
+            _preloaded[key] = surface
+
+    def _load_steps(self):
+        """Load the manifest, yielding after each asset, or None while nothing is ready and not blocking."""
+        start = time.perf_counter()
+        pool_type = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+
+        entries = {}
+        for path, size, alpha in self.manifest:
+            entries.setdefault(asset_key(path, size), (path, size, alpha))
+        self.total = len(entries)
+
+        # Warm start: anything in the on-disk cache is mapped straight in
+        pending = {}
+        for key, (path, size, alpha) in entries.items():
+            cached_start = time.perf_counter()
+            surface = self.cache.get(path, size, alpha) if self.cache else None
+            if surface is not None:
+                self._store(key, surface)
+                self.timings[key] = (0.0, time.perf_counter() - cached_start)
+                self.cached.add(key)
+                yield key
+            else:
+                pending[key] = (path, size, alpha)
+
+        if pending:
+            with pool_type(max_workers=self.workers) as pool:
+                futures = {pool.submit(_decode, path, size): key
+                           for key, (path, size, alpha) in pending.items()}
+
+                # Conversion needs the display, so it stays on this thread and
+                # overlaps with the decodes still running in the pool.
+                waiting = set(futures)
+                while waiting:
+                    finished = [future for future in waiting if future.done()]
+                    if not finished:
+                        if not self.blocking:
+                            yield None
+                            continue
+                        finished, _ = wait(waiting, return_when=FIRST_COMPLETED)
+
+                    for future in finished:
+                        waiting.discard(future)
+                        key = futures[future]
+                        try:
+                            data, decoded_size, has_alpha, decode_time = future.result()
+                        except Exception as e:
+                            self.errors[key] = e
+                            continue
+                        convert_start = time.perf_counter()
+                        path, size, alpha = pending[key]
+                        surface = self._wrap(data, decoded_size, has_alpha, alpha)
+                        self._store(key, surface)
+                        self.timings[key] = (decode_time, time.perf_counter() - convert_start)
+                        if self.cache:
+                            self.cache.put(path, size, alpha, surface)
+                        yield key
+
+        self.total_time = time.perf_counter() - start
+        self.done = True
+
+    def load_all(self):
+        """Decode every manifest entry in the pool; returns the surfaces by key."""
+        self.start()
+        return self.finish()
+
+    def start(self):
+        """Begin loading; the pool starts decoding on the first poll()."""
+        if self._steps is None:
+            self._steps = self._load_steps()
+        return self
+
+    def poll(self, budget):
+        """Load for at most budget seconds without waiting on the pool; returns whether everything is loaded."""
+        self.blocking = False
+        deadline = time.perf_counter() + budget
+        for key in self.start()._steps:
+            if key is None or time.perf_counter() >= deadline:
+                return False
+        return True
+
+    def finish(self):
+        """Load whatever is left, waiting on the pool; returns the surfaces by key."""
+        self.blocking = True
+        for _ in self.start()._steps:
+            pass
+        return self.surfaces
+
+    @property
+    def progress(self):
+        """Fraction of the manifest loaded so far."""
+        if self.done:
+            return 1.0
+        return len(self.surfaces) / self.total if self.total else 0.0
+
+    def report(self, top=None):
+        """Per-asset load times, slowest first, as printable lines."""
+        rows = sorted(self.timings.items(), key=lambda item: -sum(item[1]))
+        if top:
+            rows = rows[:top]
+
+        lines = [f"Loaded {len(self.surfaces)} assets in {self.total_time * 1000:.0f} ms "
+                 f"({len(self.cached)} from cache, {self.workers} "
+                 f"{'processes' if self.use_processes else 'threads'})"]
+        for key, (decode_time, convert_time) in rows:
+            path, size = key
+            target = f"{size[0]}x{size[1]}" if size else "native"
+            if key in self.cached:
+                lines.append(f"  {convert_time * 1000:7.1f} ms mapped from cache       {path} [{target}]")
+            else:
+                lines.append(f"  {decode_time * 1000:7.1f} ms decode  {convert_time * 1000:6.1f} ms convert  "
+                             f"{path} [{target}]")
+        for (path, size), error in self.errors.items():
+            lines.append(f"  failed: {path}: {error}")
+        return lines
+
+
+def open_cache():
+    """The on-disk AssetCache, or None when it is disabled or unusable."""
+    if not ASSET_CACHE_ENABLED:
+        return None
+    from asset_cache import AssetCache
+    try:
+        return AssetCache(ASSET_CACHE_DIR)
+    except OSError as e:
+        print(f"Warning: Asset cache disabled: {e}")
+        return None
+
+
+def retire_stale(cache):
+    """Drop cached blobs not used by this run, once every manifest has been loaded; returns how many."""
+    if not cache:
+        return 0
+    if BACKGROUND_STREAMING:
+        # StreamingBackground reads these later, outside any manifest
+        for path, size, alpha in streamed_manifest():
+            cache.touch(path, size, alpha)
+    return cache.prune()
+
+
+def start_preload(manifest=None, workers=None, use_processes=False, cache=None):
+    """
+    A started AssetLoader that registers each surface for get() as it is
+    converted. Poll it every frame, or finish() it when its assets are needed.
+    """
+    return AssetLoader(manifest, workers, use_processes, cache, publish=True).start()
+
+
+def preload(manifest=None, workers=None, use_processes=False, use_cache=ASSET_CACHE_ENABLED, cache=None):
+    """
+    Decode the manifest in parallel and register the results for get().
+
+    Needs an open display, since surfaces are converted to its pixel format.
+    With use_cache, converted pixels are read from and written to the
+    on-disk AssetCache (or cache, if one is given), and blobs for assets
+    that changed are dropped.
+    """
+    if cache is None and use_cache:
+        cache = open_cache()
+
+    loader = start_preload(manifest, workers, use_processes, cache)
+    loader.finish()
+    if manifest is None:
+        retire_stale(cache)
+    return loader
+
+
+def get(path, size=None):
+    """Returns the preloaded surface for path at size, or None if it was not preloaded."""
+    return _preloaded.get(asset_key(path, size))
@@ -0,0 +1,173 @@
+import pygame
+
+from settings import SFX, SFX_CHANNELS, SFX_VOLUME, SOUND_CACHE_ENABLED, SOUND_CACHE_DIR
+
+# Mixer channels left unreserved by SoundBank, for Sound.play() elsewhere
+FREE_CHANNELS = 4
+
+# Cleared by disable() for headless runs, which never open an audio device
+enabled = True
+_sound_cache = None
+
+
+class NullSound:
+    """Stands in for pygame.mixer.Sound when there is no audio backend."""
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def fadeout(self, ms):
+        pass
+
+    def set_volume(self, value):
+        pass
+
+    def get_volume(self):
+        return 0.0
+
+    def get_num_channels(self):
+        return 0
+
+    def get_length(self):
+        return 0.0
+
+
+def init():
+    """Open the mixer unless audio is disabled; returns whether it is available."""
+    if not enabled:
+        return False
+    if not pygame.mixer.get_init():
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"Warning: No audio device, sounds disabled: {e}")
+            return False
+    return True
+
+
+def disable():
+    """Switch to the null backend: close the mixer and hand out NullSounds."""
+    global enabled
+    enabled = False
+    if pygame.mixer.get_init():
+        pygame.mixer.quit()
+
+
+def open_sound_cache():
+    """The shared on-disk SoundCache, or None when it is disabled or unusable."""
+    global _sound_cache
+    if _sound_cache is None and SOUND_CACHE_ENABLED:
+        from sound_cache import SoundCache
+        try:
+            _sound_cache = SoundCache(SOUND_CACHE_DIR)
+        except OSError as e:
+            print(f"Warning: Sound cache disabled: {e}")
+    return _sound_cache
+
+
+def retire_stale():
+    """Once every sound is loaded, delete cached blobs no load used this run."""
+    if _sound_cache:
+        _sound_cache.prune()
+
+
+def load_sound(path, cache=None):
+    """
+    A Sound for path, or a NullSound without a mixer. Sounds are decoded
+    once and then read back as raw PCM from the SoundCache.
+    """
+    if not pygame.mixer.get_init():
+        return NullSound()
+
+    cache = cache or open_sound_cache()
+    if cache:
+        sound = cache.get(path)
+        if sound is not None:
+            return sound
+
+    sound = pygame.mixer.Sound(path)
+    if cache:
+        cache.put(path, sound)
+    return sound
+
+
+class SoundBank:
+    """
+    Owns every sound effect, loaded once, and plays them on reserved channels.
+
+    Each category in SFX_CHANNELS gets its own mixer channels, so a burst of
+    lasers can never cut off a jingle. A sound plays on at most its max
+    voices at once and not again within its cooldown; when its category is
+    full, the voice that started first is replaced. Volume and mute apply to
+    every effect and are read from here rather than from SettingsPopup.
+    """
+    def __init__(self, sounds=SFX, channels=SFX_CHANNELS, volume=SFX_VOLUME):
+        self.specs = sounds
+        self.sounds = {name: load_sound(spec[0]) for name, spec in sounds.items()}
+        self.volume = volume
+        self.muted = False
+        self.last_played = {}
+        self.started = {}       # channel -> ticks its current voice started
+
+        self.channels = {}
+        if pygame.mixer.get_init():
+            reserved = sum(channels.values())
+            if pygame.mixer.get_num_channels() < reserved + FREE_CHANNELS:
+                pygame.mixer.set_num_channels(reserved + FREE_CHANNELS)
+            # Sound.play() outside the bank only ever gets the channels left over
+            pygame.mixer.set_reserved(reserved)
+            first = 0
+            for category, count in channels.items():
+                self.channels[category] = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+                first += count
+        self._apply_volume()
+
+    def __getitem__(self, name):
+        return self.sounds[name]
+
+    def _apply_volume(self):
+        for name, sound in self.sounds.items():
+            gain = self.specs[name][4]
+            sound.set_volume(0.0 if self.muted else min(1.0, self.volume * gain))
+
+    def set_volume(self, volume):
+        self.volume = max(0.0, min(1.0, volume))
+        self._apply_volume()
+
+    def set_muted(self, muted):
+        self.muted = muted
+        self._apply_volume()
+
+    def play(self, name):
+        """Play a sound on its category's channels; returns the Channel, or None if it was held back."""
+        if self.muted or not self.volume:
+            return None
+        _, category, max_voices, cooldown, _ = self.specs[name]
+        channels = self.channels.get(category)
+        if not channels:
+            return None
+
+        now = pygame.time.get_ticks()
+        if now - self.last_played.get(name, -cooldown) < cooldown:
+            return None
+
+        sound = self.sounds[name]
+        busy = [channel for channel in channels if channel.get_busy()]
+        if sum(1 for channel in busy if channel.get_sound() is sound) >= max_voices:
+            return None
+
+        idle = [channel for channel in channels if not channel.get_busy()]
+        channel = idle[0] if idle else min(busy, key=lambda c: self.started.get(c, 0))
+        channel.play(sound)
+        self.started[channel] = now
+        self.last_played[name] = now
+        return channel
+
+    def stop(self, name=None):
+        """Stop one sound, or every effect."""
+        for channels in self.channels.values():
+            for channel in channels:
+                if channel.get_busy() and (name is None or channel.get_sound() is self.sounds[name]):
+                    channel.stop()
@@ -1,9 +1,15 @@
 # In your background.py file, replace the existing content with this:
-import pygame, os
+import pygame, os, threading
+import asset_loader
+from frame_codec import load_index, KEYFRAME_FILE, ATLAS_FILE
 from settings import *
 
 def load_image(filename):
     """A helper function to load and scale images."""
+    preloaded = asset_loader.get(filename, SCREEN_SIZE)
+    if preloaded is not None:
+        return preloaded
+
     try:
         img = pygame.image.load(filename).convert_alpha()
         img = pygame.transform.scale(img, SCREEN_SIZE)
@@ -13,6 +19,34 @@ def load_image(filename):
         return pygame.Surface(SCREEN_SIZE) # Return a fallback surface
 
 
+def stream_frame(filename, cache=None, convert=True):
+    """
+    Load one background frame for StreamingBackground, bypassing the preload.
+
+    Reads the memory-mapped AssetCache blob when there is one, so a streamed
+    frame costs a page-in instead of a PNG decode. With convert=False the
+    display is never touched, so it is safe off the main thread; the frame
+    must then be converted with convert_alpha() on the main thread.
+    """
+    if cache is not None:
+        img = cache.get(filename, SCREEN_SIZE, True, convert)
+        if img is not None:
+            return img
+
+    try:
+        img = pygame.image.load(filename)
+        img = pygame.transform.scale(img, SCREEN_SIZE)
+        if convert:
+            img = img.convert_alpha()
+    except pygame.error as e:
+        print(f"Error loading image {filename}: {e}")
+        return pygame.Surface(SCREEN_SIZE)
+
+    if cache is not None:
+        cache.put(filename, SCREEN_SIZE, True, img)
+    return img
+
+
 class AnimatedBackground:
     def __init__(self, path_base, num_frames, animation_speed=100):
         self.frames = []
@@ -34,4 +68,137 @@ class AnimatedBackground:
             self.current_frame = self.frames[self.frame_index]
     
     def get_current_frame(self):
-        return self.current_frame
\ No newline at end of file
+        return self.current_frame
+
+
+class StreamingBackground:
+    """
+    AnimatedBackground that keeps only a small ring buffer of frames resident.
+
+    A daemon thread decodes up to `prefetch` frames ahead of frame_index,
+    without touching the display; update() converts each frame to the
+    display format on the main thread when it first shows it. update()
+    never waits for the thread: if the next frame is not ready yet, the
+    current one stays on screen and the advance is retried on the next tick.
+    """
+    def __init__(self, path_base, num_frames, animation_speed=100,
+                 memory_cap=BACKGROUND_STREAM_MEMORY_CAP, prefetch=BACKGROUND_STREAM_PREFETCH, cache=None):
+        self.paths = [os.path.join(path_base, f"{i}.png") for i in range(1, num_frames + 1)]
+        self.cache = cache
+
+        frame_bytes = SCREEN_WIDTH * SCREEN_HEIGHT * 4
+        self.capacity = max(2, min(num_frames, memory_cap // frame_bytes))
+        self.prefetch = max(1, min(prefetch, self.capacity - 1))
+
+        self.frames = {}        # frame index -> surface, at most self.capacity of them
+        self.unconverted = set()    # indices in frames still in the decoder's pixel format
+        self.misses = 0         # ticks where the next frame was not ready in time
+        self.condition = threading.Condition()
+        self.running = True
+
+        self.animation_speed = animation_speed
+        self.frame_index = 0
+        self.animation_timer = 0
+        self.frames[0] = stream_frame(self.paths[0], self.cache)
+        self.current_frame = self.frames[0]
+
+        self.thread = threading.Thread(target=self._decode_ahead, name="background-stream", daemon=True)
+        self.thread.start()
+
+    def _wanted(self):
+        """Frame indices that should be resident, current frame first."""
+        count = len(self.paths)
+        return [(self.frame_index + i) % count for i in range(min(self.prefetch + 1, count))]
+
+    def _decode_ahead(self):
+        while True:
+            with self.condition:
+                while self.running and all(i in self.frames for i in self._wanted()):
+                    self.condition.wait()
+                if not self.running:
+                    return
+                index = next(i for i in self._wanted() if i not in self.frames)
+
+            # Decoding happens outside the lock so update() is never held up.
+            frame = stream_frame(self.paths[index], self.cache, convert=False)
+
+            with self.condition:
+                wanted = self._wanted()
+                if index in wanted:
+                    self.frames[index] = frame
+                    self.unconverted.add(index)
+                # Evict whatever the animation has already moved past
+                for stale in [i for i in self.frames if i not in wanted]:
+                    if len(self.frames) <= self.capacity:
+                        break
+                    del self.frames[stale]
+                    self.unconverted.discard(stale)
+
+    def update(self, dt):
+        self.animation_timer += dt
+        if self.animation_timer >= self.animation_speed:
+            next_index = (self.frame_index + 1) % len(self.paths)
+            with self.condition:
+                frame = self.frames.get(next_index)
+                if frame is None:
+                    self.misses += 1
+                    self.condition.notify()
+                    return
+                if next_index in self.unconverted:
+                    frame = self.frames[next_index] = frame.convert_alpha()
+                    self.unconverted.discard(next_index)
+                self.animation_timer = 0
+                self.frame_index = next_index
+                self.current_frame = frame
+                self.condition.notify()
+
+    def get_current_frame(self):
+        return self.current_frame
+
+    def close(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join()
+
+
+class DeltaBackground:
+    """
+    AnimatedBackground for a loop encoded by frame_codec.py.
+
+    Only the keyframe and an atlas of changed tiles are kept, both opaque.
+    update() patches the changed tiles into one canvas instead of swapping
+    whole frames; dirty_rects lists what the last advance touched.
+    """
+    def __init__(self, path_base, animation_speed=100, index=None):
+        index = index or load_index(path_base)
+        self.deltas = [[(pygame.Rect(x, y, w, h), (ax, ay, w, h)) for x, y, w, h, ax, ay in delta]
+                       for delta in index["deltas"]]
+
+        self.canvas = self._load(os.path.join(path_base, KEYFRAME_FILE)).copy()
+        self.atlas = self._load(os.path.join(path_base, ATLAS_FILE))
+
+        self.animation_speed = animation_speed
+        self.frame_index = 0
+        self.animation_timer = 0
+        self.current_frame = self.canvas
+        self.dirty_rects = []
+
+    def _load(self, path):
+        image = asset_loader.get(path)
+        if image is None:
+            image = pygame.image.load(path).convert()
+        return image
+
+    def update(self, dt):
+        self.animation_timer += dt
+        self.dirty_rects = []
+        if self.animation_timer >= self.animation_speed:
+            self.animation_timer = 0
+            patches = self.deltas[self.frame_index]
+            self.canvas.blits([(self.atlas, rect, area) for rect, area in patches], doreturn=False)
+            self.dirty_rects = [rect for rect, area in patches]
+            self.frame_index = (self.frame_index + 1) % len(self.deltas)
+
+    def get_current_frame(self):
+        return self.current_frame
@@ -0,0 +1,350 @@
+"""
+Benchmarks for the game's hot paths, compared against a committed baseline.
+
+Every result is a time in milliseconds, lower is better. Run with:
+    python benchmark.py                     compare against benchmark_baseline.json
+    python benchmark.py --update-baseline   record this machine's numbers as the baseline
+The exit status is 1 when any benchmark is slower than its baseline by more
+than the threshold, so the suite can gate a deploy.
+
+Every run also times a fixed calibration workload, and the baseline is
+scaled by how much faster or slower it ran than when the baseline was
+recorded, so a baseline from one machine can gate another. The scaling
+only follows CPU speed: startup and asset loading also depend on the
+disk, so re-record the baseline on the machine that runs the gate.
+"""
+import os, sys, io, json, time, random, shutil, argparse, tempfile, statistics, subprocess, contextlib
+
+BASELINE_FILE = "benchmark_baseline.json"
+RESULTS_FILE = "benchmark_results.json"
+THRESHOLD = 0.25            # fraction slower than the baseline that counts as a regression
+ENEMY_COUNTS = (1, 10, 100, 1000)
+CALIBRATION = "calibration"
+
+# Run in a fresh interpreter, so imports, fonts and the display are all
+# part of the measured startup. Prints the seconds to the menu and then
+# the seconds load_game_scene() takes on top of it.
+STARTUP_SCRIPT = """
+import time, json, contextlib, io
+start = time.perf_counter()
+import asset_loader
+asset_loader.ASSET_CACHE_DIR = {cache_dir!r}
+with contextlib.redirect_stdout(io.StringIO()):
+    import main
+    game = main.Game(headless_mode=True)
+    menu = time.perf_counter()
+    game.load_game_scene()
+print(json.dumps([menu - start, time.perf_counter() - menu]))
+"""
+
+
+def _median_ms(function, repeat, number=1):
+    """Median wall time of number calls to function, in ms per call."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) * 1000 / number)
+    return statistics.median(samples)
+
+
+def bench_calibration(repeat, number=5):
+    """Python arithmetic and alpha blits that depend on the machine, not on the game."""
+    import pygame
+
+    target = pygame.Surface((800, 600))
+    sprite = pygame.Surface((100, 100), pygame.SRCALPHA)
+    sprite.fill((255, 255, 255, 128))
+
+    def work():
+        sum(i * i for i in range(20000))
+        target.blits([(sprite, (i, i)) for i in range(200)], False)
+
+    return {CALIBRATION: _median_ms(work, max(repeat, 5), number)}
+
+
+def bench_startup(repeat):
+    """
+    Game.__init__ and then load_game_scene in a new process, with an empty
+    and then a filled asset cache.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        script = STARTUP_SCRIPT.format(cache_dir=os.path.join(cache_dir, "assets"))
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+
+        def launch():
+            output = subprocess.run([sys.executable, "-c", script], env=env, check=True,
+                                    capture_output=True, text=True).stdout
+            return [seconds * 1000 for seconds in json.loads(output.strip().splitlines()[-1])]
+
+        cold = []
+        for _ in range(repeat):
+            shutil.rmtree(os.path.join(cache_dir, "assets"), ignore_errors=True)
+            cold.append(launch())
+        warm = [launch() for _ in range(repeat)]
+        for name, samples in (("cold", cold), ("warm", warm)):
+            results[f"startup_{name}"] = statistics.median(menu for menu, _ in samples)
+            results[f"startup_game_scene_{name}"] = statistics.median(scene for _, scene in samples)
+    return results
+
+
+def bench_asset_load(repeat):
+    """Every manifest image decoded and converted, uncached and from a filled cache."""
+    import asset_loader
+    from asset_cache import AssetCache
+
+    results = {"asset_load_uncached": _median_ms(lambda: asset_loader.AssetLoader().load_all(), repeat)}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        asset_loader.AssetLoader(cache=AssetCache(cache_dir)).load_all()
+        results["asset_load_cached"] = _median_ms(
+            lambda: asset_loader.AssetLoader(cache=AssetCache(cache_dir)).load_all(), repeat)
+    return results
+
+
+def _fill_stage(game, count):
+    """A fresh play state holding count enemies spread over the top half of the screen."""
+    from main import AnimatedEnemy
+    from settings import SCREEN_HEIGHT
+
+    game.reset_game()
+    game.set_spawn_interval(0)
+    for _ in range(count):
+        # Problems from the pool, as spawn_enemies draws them, so the
+        # questions match the swarm benchmark's
+        enemy = AnimatedEnemy(game.enemy_frames, game.font_big, game.score, game.current_stage["enemy_speed"],
+                              game.problems.draw(game.score))
+        enemy.set_position((enemy.pos.x, random.uniform(0, SCREEN_HEIGHT / 2)))
+        game.add_enemy(enemy)
+
+
+def bench_play_frames(game, repeat, frames=120):
+    """Game.run frame time in the play state, per number of enemies on screen."""
+    results = {}
+    for count in ENEMY_COUNTS:
+        samples = []
+        for _ in range(repeat):
+            _fill_stage(game, count)
+            with contextlib.redirect_stdout(io.StringIO()):
+                frames_per_second = game.run(frames)
+            samples.append(1000 / frames_per_second)
+        results[f"play_frame_{count}_enemies"] = statistics.median(samples)
+    return results
+
+
+def bench_swarm_frames(game, repeat, frames=120, counts=(1000, 5000)):
+    """Game.run frame time in swarm mode, per number of enemies in the swarm."""
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT, SWARM_ENEMY_SPEED
+
+    results = {}
+    mode, game.mode = game.mode, "swarm"
+    for count in counts:
+        samples = []
+        for _ in range(repeat):
+            game.reset_game()
+            game.set_spawn_interval(0)
+            for _ in range(count):
+                game.swarm.spawn(random.uniform(90, SCREEN_WIDTH - 90), random.uniform(0, SCREEN_HEIGHT / 2),
+                                 SWARM_ENEMY_SPEED, game.problems.draw(game.score))
+            with contextlib.redirect_stdout(io.StringIO()):
+                frames_per_second = game.run(frames)
+            samples.append(1000 / frames_per_second)
+        results[f"swarm_frame_{count}_enemies"] = statistics.median(samples)
+    game.mode = mode
+    return results
+
+
+def bench_starfield(game, repeat, number=50):
+    """Starfield update and draw per frame, with the default layers and ten times the stars."""
+    from starfield import Starfield
+    from settings import SCREEN_SIZE, STAR_LAYERS
+
+    results = {}
+    for name, layers in (("default", STAR_LAYERS),
+                         ("x10", [(count * 10, *rest) for count, *rest in STAR_LAYERS])):
+        starfield = Starfield(SCREEN_SIZE, layers)
+
+        def frame():
+            starfield.update(1000 / 60)
+            starfield.draw(game.screen)
+
+        results[f"starfield_{name}"] = _median_ms(frame, repeat, number)
+    return results
+
+
+def bench_generate_problem(repeat, number=10000):
+    """generate_problem per call, over all three score tiers."""
+    from main import generate_problem
+
+    scores = [50, 150, 250]
+    return {"generate_problem_x1000": _median_ms(
+        lambda: [generate_problem(score) for score in scores], repeat, number // len(scores)) * 1000 / len(scores)}
+
+
+def bench_problem_pool(repeat, number=10000, live=20):
+    """ProblemPool.draw per call with live answers held, releasing the oldest as it goes."""
+    from problems import ProblemPool
+
+    def draw_all():
+        pool = ProblemPool(seed=0)
+        answers = []
+        for i in range(number):
+            answers.append(pool.draw(250)[1])
+            if len(answers) > live:
+                pool.release(answers.pop(0))
+
+    return {"problem_pool_draw_x1000": _median_ms(draw_all, repeat) * 1000 / number}
+
+
+def bench_groupcollide(game, repeat, populations=(10, 100, 1000)):
+    """
+    Laser/enemy collisions with as many lasers as enemies, through
+    pygame.sprite.groupcollide and through the collision.SpatialHash broadphase.
+    """
+    import pygame
+    import collision
+    from main import Laser, AnimatedEnemy
+    from settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    results = {}
+    for count in populations:
+        laser_group = pygame.sprite.Group()
+        for _ in range(count):
+            start = (random.uniform(0, SCREEN_WIDTH), SCREEN_HEIGHT - 120)
+            target = (random.uniform(0, SCREEN_WIDTH), random.uniform(0, SCREEN_HEIGHT))
+            laser_group.add(Laser(game.laser_frames, start, target))
+        enemy_group = pygame.sprite.Group(
+            AnimatedEnemy(game.enemy_frames, game.font_big, 0, 0) for _ in range(count))
+        grid = collision.SpatialHash()
+        for enemy in enemy_group:
+            enemy.set_position((enemy.pos.x, random.uniform(0, SCREEN_HEIGHT)))
+            grid.insert(enemy)
+
+        results[f"groupcollide_{count}x{count}"] = _median_ms(
+            lambda: pygame.sprite.groupcollide(laser_group, enemy_group, False, False), repeat, 5)
+        results[f"spatial_hash_{count}x{count}"] = _median_ms(
+            lambda: collision.groupcollide(laser_group, grid, False, False), repeat, 5)
+    return results
+
+
+def bench_popups(game, repeat, number=50):
+    """One display() of each menu popup while it is open."""
+    results = {}
+    for name, popup in (("settings_popup", game.settings_popup), ("stats_popup", game.stats_popup)):
+        was_active, popup.is_active = popup.is_active, True
+        results[f"{name}_display"] = _median_ms(popup.display, repeat, number)
+        popup.is_active = was_active
+    return results
+
+
+def run_all(repeat, only=None):
+    """Run every benchmark whose name contains only; returns {name: ms}."""
+    groups = [
+        ("startup", lambda game: bench_startup(repeat)),
+        ("asset_load", lambda game: bench_asset_load(repeat)),
+        ("play_frame", lambda game: bench_play_frames(game, repeat)),
+        ("swarm_frame", lambda game: bench_swarm_frames(game, repeat)),
+        ("starfield", lambda game: bench_starfield(game, repeat)),
+        ("generate_problem", lambda game: bench_generate_problem(repeat)),
+        ("problem_pool", lambda game: bench_problem_pool(repeat)),
+        ("collision", lambda game: bench_groupcollide(game, repeat)),
+        ("popup", lambda game: bench_popups(game, repeat)),
+    ]
+    if only:
+        groups = [(name, bench) for name, bench in groups if only in name]
+    # Always run, as compare() scales the baseline by it
+    groups.insert(0, (CALIBRATION, lambda game: bench_calibration(repeat)))
+
+    import main
+    random.seed(0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = main.Game(headless_mode=True)
+        game.load_game_scene()
+
+    results = {}
+    for name, bench in groups:
+        with contextlib.redirect_stdout(io.StringIO()):
+            group_results = bench(game)
+        for key, value in group_results.items():
+            print(f"{key:>32}: {value:10.3f} ms")
+        results.update(group_results)
+    return results
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """
+    Printable comparison lines and the names of benchmarks that regressed.
+
+    Baseline times are scaled by this run's calibration over the
+    baseline's, when both have one, before they are compared.
+    """
+    lines, regressions = [], []
+    scale = 1
+    if results.get(CALIBRATION) and baseline.get(CALIBRATION):
+        scale = results[CALIBRATION] / baseline[CALIBRATION]
+        lines.append(f"{CALIBRATION:>32}: this machine runs at {1 / scale:.2f}x the baseline's speed")
+    for name, value in results.items():
+        if name == CALIBRATION:
+            continue
+        base = baseline.get(name)
+        if base is None:
+            lines.append(f"{name:>32}: {value:10.3f} ms   (no baseline)")
+            continue
+        base *= scale
+        change = value / base - 1 if base else 0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(f"{name:>32}: {value:10.3f} ms vs {base:10.3f} ms ({change:+.0%}){flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ArithMetron hot paths.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare against")
+    parser.add_argument("--output", default=RESULTS_FILE, help="where to write this run's results")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="fraction slower than baseline that fails the run (default %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark, the median is kept")
+    parser.add_argument("--only", help="run only benchmark groups whose name contains this")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    results = {name: round(value, 4) for name, value in run_all(args.repeat, args.only).items()}
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        print(f"Warning: No baseline at {args.baseline}, run with --update-baseline to record one")
+        return 0
+
+    lines, regressions = compare(results, baseline, args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) more than {args.threshold:.0%} slower than the baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
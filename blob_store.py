@@ -0,0 +1,104 @@
+import os, hashlib, argparse
+
+
+class BlobStore:
+    """
+    Directory of files derived from source files, for AssetCache and
+    SoundCache.
+
+    Each blob is named by a hash of the source path, its mtime and file
+    size and whatever else the subclass's blob_path() adds, so editing a
+    source simply misses the store. Blobs found, written or touched are
+    remembered, and prune() deletes the rest: the ones left behind by
+    edited sources or another display or mixer format.
+    """
+    kind = "cache"          # for messages
+    extension = ""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.used = set()   # blob names found, written or touched this run
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _blob_path(self, path, *key):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = "|".join(str(part) for part in (os.path.normpath(path), stat.st_mtime_ns, stat.st_size) + key)
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest() + self.extension
+        return os.path.join(self.directory, name)
+
+    def blob_path(self, path):
+        return self._blob_path(path)
+
+    def _find(self, *args):
+        """The existing blob for blob_path(*args), or None after counting a miss."""
+        blob = self.blob_path(*args)
+        if blob is None or not os.path.exists(blob):
+            self.misses += 1
+            return None
+        return blob
+
+    def _hit(self, blob):
+        self.used.add(os.path.basename(blob))
+        self.hits += 1
+
+    def _write(self, blob, *chunks):
+        """Write a blob through a temp file, so a crash never leaves half of one."""
+        temp = blob + ".tmp"
+        try:
+            with open(temp, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp, blob)
+            self.used.add(os.path.basename(blob))
+        except OSError as e:
+            print(f"Warning: Could not write {self.kind} {blob}: {e}")
+
+    def touch(self, *args):
+        """Keep the blob for blob_path(*args) through the next prune() without loading it."""
+        blob = self.blob_path(*args)
+        if blob is not None:
+            self.used.add(os.path.basename(blob))
+
+    def prune(self):
+        """Delete blobs that were not found, written or touched in this run; returns how many."""
+        removed = 0
+        for name in os.listdir(self.directory):
+            # Skips subdirectories such as the SoundCache's inside the AssetCache's
+            if name not in self.used and os.path.isfile(os.path.join(self.directory, name)):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except OSError:
+                    pass    # still mapped by another process
+        return removed
+
+    def clear(self):
+        """Delete every blob; returns how many."""
+        self.used.clear()
+        return self.prune()
+
+
+def open_from_args(store_class, description, directory, argv=None):
+    """
+    The store a build script works on, from its --dir and --clear options.
+
+    Returns None once --clear has emptied the store, as there is then
+    nothing left to build.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--dir", default=directory, help="cache directory")
+    parser.add_argument("--clear", action="store_true", help="delete every blob and exit")
+    args = parser.parse_args(argv)
+
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    store = store_class(args.dir)
+    if args.clear:
+        print(f"Removed {store.clear()} blobs from the {store.kind} in {args.dir}")
+        return None
+    return store
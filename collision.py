@@ -0,0 +1,109 @@
+from settings import COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Uniform-grid broadphase for sprites with a rect.
+
+    Every sprite is filed in each cell its rect overlaps. refresh() re-files
+    only the sprites whose rect moved into different cells since the last
+    call, so keeping a slowly falling swarm up to date is one integer
+    division per sprite and almost no set updates.
+    """
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}     # (cx, cy) -> set of sprites
+        self.spans = {}     # sprite -> (x0, y0, x1, y1) cell range it is filed under
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __contains__(self, sprite):
+        return sprite in self.spans
+
+    def _span(self, rect):
+        size = self.cell_size
+        return (rect.left // size, rect.top // size, (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _file(self, sprite, span):
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(sprite)
+
+    def _unfile(self, sprite, span):
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells[(cx, cy)]
+                cell.discard(sprite)
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    def insert(self, sprite):
+        if sprite in self.spans:
+            return self.move(sprite)
+        span = self._span(sprite.rect)
+        self.spans[sprite] = span
+        self._file(sprite, span)
+
+    def remove(self, sprite):
+        """Forget a sprite; sprites that are not in the grid are ignored."""
+        span = self.spans.pop(sprite, None)
+        if span is not None:
+            self._unfile(sprite, span)
+
+    def move(self, sprite):
+        """Re-file a sprite after its rect changed, if it now spans other cells."""
+        span = self._span(sprite.rect)
+        old = self.spans[sprite]
+        if span != old:
+            self._unfile(sprite, old)
+            self.spans[sprite] = span
+            self._file(sprite, span)
+
+    def refresh(self):
+        for sprite in list(self.spans):
+            self.move(sprite)
+
+    def clear(self):
+        self.cells.clear()
+        self.spans.clear()
+
+    def query(self, rect):
+        """Sprites whose rect overlaps rect."""
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            candidates = cells.get((x0, y0), ())
+        else:
+            candidates = set()
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cell = cells.get((cx, cy))
+                    if cell:
+                        candidates.update(cell)
+        return [sprite for sprite in candidates if rect.colliderect(sprite.rect)]
+
+
+def groupcollide(group, grid, dokill_group=False, dokill_grid=False):
+    """
+    pygame.sprite.groupcollide(group, <sprites in grid>, ...) through the grid.
+
+    Returns the same {sprite: [sprites hit]} dictionary. As with pygame, a
+    sprite killed by one hit is gone for the rest of the call, so it appears
+    in one list at most; each list may come in a different order.
+    """
+    hits = {}
+    for sprite in group.sprites():
+        collided = grid.query(sprite.rect)
+        if not collided:
+            continue
+        if dokill_grid:
+            for other in collided:
+                grid.remove(other)
+                other.kill()
+        if dokill_group:
+            sprite.kill()
+        hits[sprite] = collided
+    return hits
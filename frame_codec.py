@@ -0,0 +1,116 @@
+"""
+Keyframe + dirty-tile encoding for looping backgrounds.
+
+An encoded loop is a directory holding:
+    keyframe.png   the first frame, already scaled to the screen
+    tiles.png      an atlas of every tile that changes between two frames
+    index.json     for each transition i -> i + 1 (wrapping back to 0), the
+                   screen rects to patch and where each one sits in the atlas
+
+Encode once with:  python frame_codec.py assets/background/in_game/ assets/background/in_game_encoded/
+"""
+import pygame, os, sys, json, argparse
+
+from settings import *
+
+
+INDEX_FILE = "index.json"
+KEYFRAME_FILE = "keyframe.png"
+ATLAS_FILE = "tiles.png"
+ATLAS_WIDTH = 1024
+
+
+def load_index(directory):
+    """The parsed index.json of an encoded loop, or None if there is none."""
+    try:
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _dirty_runs(previous, current, tile):
+    """Changed tiles between two frames, merged into horizontal runs per tile row."""
+    width, height = current.get_size()
+    runs = []
+    for y in range(0, height, tile):
+        h = min(tile, height - y)
+        start = None
+        for x in range(0, width + tile, tile):
+            changed = False
+            if x < width:
+                rect = pygame.Rect(x, y, min(tile, width - x), h)
+                changed = (pygame.image.tobytes(previous.subsurface(rect), "RGB")
+                           != pygame.image.tobytes(current.subsurface(rect), "RGB"))
+            if changed and start is None:
+                start = x
+            elif not changed and start is not None:
+                runs.append(pygame.Rect(start, y, min(x, width) - start, h))
+                start = None
+    return runs
+
+
+def encode(source_dir, num_frames, output_dir, size=SCREEN_SIZE, tile=BACKGROUND_TILE_SIZE):
+    """Encode frames 1.png..N.png of source_dir; returns (patch count, bytes of atlas pixels)."""
+    frames = [pygame.transform.scale(pygame.image.load(os.path.join(source_dir, f"{i}.png")), size).convert()
+              for i in range(1, num_frames + 1)]
+
+    transitions = []
+    for i in range(num_frames):
+        transitions.append(_dirty_runs(frames[i], frames[(i + 1) % num_frames], tile))
+
+    # Shelf-pack the patches: every run is one tile high, so each shelf is too
+    patches = []
+    atlas_x = atlas_y = 0
+    for runs in transitions:
+        for rect in runs:
+            if atlas_x + rect.width > ATLAS_WIDTH:
+                atlas_x = 0
+                atlas_y += tile
+            patches.append((rect, atlas_x, atlas_y))
+            atlas_x += rect.width
+    atlas_height = atlas_y + tile if patches else 1
+
+    atlas = pygame.Surface((ATLAS_WIDTH, atlas_height))
+    deltas = []
+    patch_iter = iter(patches)
+    for i, runs in enumerate(transitions):
+        target = frames[(i + 1) % num_frames]
+        delta = []
+        for _ in runs:
+            rect, x, y = next(patch_iter)
+            atlas.blit(target, (x, y), rect)
+            delta.append([rect.x, rect.y, rect.width, rect.height, x, y])
+        deltas.append(delta)
+
+    os.makedirs(output_dir, exist_ok=True)
+    pygame.image.save(frames[0], os.path.join(output_dir, KEYFRAME_FILE))
+    pygame.image.save(atlas, os.path.join(output_dir, ATLAS_FILE))
+    with open(os.path.join(output_dir, INDEX_FILE), "w") as f:
+        json.dump({"size": list(size), "tile": tile, "frames": num_frames, "deltas": deltas}, f)
+
+    return len(patches), ATLAS_WIDTH * atlas_height * 4
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encode a looping background as a keyframe plus dirty tiles.")
+    parser.add_argument("source", nargs="?", default=GAME_BACKGROUND_PATH, help="folder of 1.png..N.png frames")
+    parser.add_argument("output", nargs="?", default=GAME_BACKGROUND_ENCODED_PATH, help="output folder")
+    parser.add_argument("--frames", type=int, default=GAME_BACKGROUND_FRAMES)
+    parser.add_argument("--tile", type=int, default=BACKGROUND_TILE_SIZE)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    patches, atlas_bytes = encode(args.source, args.frames, args.output, tile=args.tile)
+    full_bytes = SCREEN_WIDTH * SCREEN_HEIGHT * 4
+    print(f"{args.frames} frames -> 1 keyframe + {patches} patches "
+          f"({(full_bytes + atlas_bytes) / 2**20:.1f} MB resident vs {args.frames * full_bytes / 2**20:.1f} MB)")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Headless runs for soak tests and benchmarks: no window, no audio, input
+from a script, and a simulation that runs as fast as the machine allows.
+"""
+import pygame, os, io, sys, json, contextlib
+
+
+def use_dummy_drivers():
+    """Point SDL at its dummy video and audio drivers, re-opening the display if needed."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    if pygame.display.get_init() and pygame.display.get_driver() != "dummy":
+        pygame.display.quit()
+    pygame.display.init()
+
+
+def key_event(key, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0)
+
+
+def text_events(text):
+    """KEYDOWN events typing text; a newline submits."""
+    events = []
+    for char in text:
+        if char in "\r\n":
+            events.append(key_event(pygame.K_RETURN, "\r"))
+        else:
+            events.append(key_event(pygame.key.key_code(char), char))
+    return events
+
+
+def click_events(pos):
+    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(pos), button=1),
+            pygame.event.Event(pygame.MOUSEBUTTONUP, pos=tuple(pos), button=1)]
+
+
+class ScriptedInput:
+    """
+    Feeds input to a headless Game, one rendered frame at a time.
+
+    A script is a list of steps, each {"frame": n} plus one of:
+        "keys": "12\n"       characters to type, a newline submits
+        "key": "escape"      one key, by its pygame name
+        "click": [x, y]      a left click
+        "play": true         click the menu's Play button
+    With autoplay, the answer of the lowest enemy is also typed every
+    autoplay_interval frames while a stage is being played.
+    """
+    def __init__(self, script=(), autoplay=False, autoplay_interval=30):
+        self.script = sorted(script, key=lambda step: step["frame"])
+        self.autoplay = autoplay
+        self.autoplay_interval = autoplay_interval
+        self.position = 0
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        with open(path) as f:
+            return cls(json.load(f), **kwargs)
+
+    def _events(self, game, step):
+        if "keys" in step:
+            return text_events(step["keys"])
+        if "key" in step:
+            return [key_event(pygame.key.key_code(step["key"]))]
+        if "click" in step:
+            return click_events(step["click"])
+        if step.get("play"):
+            return click_events(game.play_button_position())
+        return []
+
+    def _autoplay_events(self, game):
+        if game.game_state == "menu":
+            return click_events(game.play_button_position())
+        if game.game_state == "level_cleared":
+            return [key_event(pygame.K_RETURN, "\r")]
+        if game.game_state == "play" and not game.game_over and not game.paused:
+            answer = game.lowest_answer()
+            if answer is not None:
+                return text_events(f"{answer}\n")
+        return []
+
+    def feed(self, game, frame):
+        """Post every event due at this frame."""
+        events = []
+        while self.position < len(self.script) and self.script[self.position]["frame"] <= frame:
+            events += self._events(game, self.script[self.position])
+            self.position += 1
+
+        if self.autoplay and frame % self.autoplay_interval == 0:
+            events += self._autoplay_events(game)
+
+        for event in events:
+            pygame.event.post(event)
+
+
+def check_stage_clear(max_frames=10000):
+    """
+    Autoplay the first stage with the profiler overlay up and check that,
+    once it is cleared, the frozen VICTORY screen is what is presented and
+    the overlay stayed out of the frozen frame.
+    """
+    import main
+    game = main.Game(headless_mode=True, script=ScriptedInput(autoplay=True, autoplay_interval=1))
+    game.profiler.toggle()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(max_frames):
+            game.run(1)
+            if game.game_state == "level_cleared":
+                break
+        else:
+            raise AssertionError(f"the first stage was not cleared in {max_frames} frames")
+        # Stop autoplay pressing Enter, and let the screen settle
+        game.script = None
+        game.run(3)
+
+    frame = game.result_screen.frame
+    assert frame is not None, "the stage clear screen was never frozen"
+    screen = pygame.display.get_surface()
+    overlay = game.profiler.draw(screen)
+    pixels = lambda surface: pygame.image.tobytes(surface, "RGB")
+    assert pixels(frame.subsurface(overlay)) != pixels(screen.subsurface(overlay)), \
+        "the profiler overlay was frozen into the result screen"
+    shown = screen.copy()
+    shown.blit(frame, overlay, overlay)
+    assert pixels(shown) == pixels(frame), "the frozen result screen is not what is on screen"
+
+
+def main():
+    """Scripted checks of the game, run headless: python headless.py"""
+    check_stage_clear()
+    print("Stage clear: frozen result screen presented")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
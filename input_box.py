@@ -1,18 +1,19 @@
 import pygame
 
 from settings import FONT, FONT_SIZE
+from support import get_font, render_text
 
 pygame.init()
 
 class InputBox:
     def __init__(self, x, y, width, height, font):
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(FONT, FONT_SIZE['med'])
+        self.font = get_font(FONT, FONT_SIZE['med'])
         self.color = (60, 60, 60)
         self.text_color = (255, 255, 255)
         self.text = ''
         self.active = True
-        self.txt_surface = font.render(self.text, True, self.text_color)
+        self.txt_surface = render_text(font, self.text, self.text_color)
         self.cursor_visible = True
         self.cursor_timer = 0
         
@@ -23,12 +24,12 @@ class InputBox:
             elif event.key == pygame.K_RETURN:
                 submitted_text = self.text
                 self.text = ''
-                self.txt_surface = self.font.render(self.text, True, self.text_color)
+                self.txt_surface = render_text(self.font, self.text, self.text_color)
                 return submitted_text
             else:
                 if event.unicode.isdigit():
                     self.text += event.unicode
-            self.txt_surface = self.font.render(self.text, True, self.text_color)
+            self.txt_surface = render_text(self.font, self.text, self.text_color)
             self.cursor_timer = 0
         return None
 
@@ -39,8 +40,9 @@ class InputBox:
             self.cursor_visible = not self.cursor_visible
 
     def draw(self, screen):
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
-        screen.blit(self.txt_surface, (self.rect.x + 10, self.rect.y + 10))
+        drawn = pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
+        drawn = drawn.union(screen.blit(self.txt_surface, (self.rect.x + 10, self.rect.y + 10)))
         if self.cursor_visible and self.active:
             cursor_pos = self.txt_surface.get_width() + 5
-            pygame.draw.line(screen, self.text_color, (self.rect.x + cursor_pos, self.rect.y + 5), (self.rect.x + cursor_pos, self.rect.y + self.rect.height - 5), 2)
+            drawn = drawn.union(pygame.draw.line(screen, self.text_color, (self.rect.x + cursor_pos, self.rect.y + 5), (self.rect.x + cursor_pos, self.rect.y + self.rect.height - 5), 2))
+        return drawn
@@ -1,15 +1,28 @@
-import pygame, sys, random, os, math
+import pygame, sys, random, os, math, time, argparse
 from settings import *
 from animated_sprite import AnimatedSprite
-from stage_cleared import StageCleared
-from game_cleared import GameCleared
-from game_over import GameOver
-from background import AnimatedBackground
+import result_screen
+from background import AnimatedBackground, StreamingBackground, DeltaBackground
+from frame_codec import load_index
 from pop_up import *
-from support import draw_stars
+from support import get_font, render_text
 from Stats import MyStatsPopup
+from stats_store import StatsStore
+from renderer import DirtyRenderer, RenderQueue, LAYER_HUD
+from profiler import FrameProfiler
+from problems import ProblemPool
+from answer_index import AnswerIndex
+from collision import SpatialHash
+from swarm import EnemySwarm
+from starfield import Starfield
+import swarm
+import collision
+from transform_cache import rotated, scaled_frames, labelled
+import transform_cache
+import asset_loader
+import audio
+import headless
 
-pygame.mixer.init()
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 os.chdir(BASE_DIR)
@@ -21,8 +34,10 @@ def load_frames(filenames, default_color, is_player=True):
     try:
         for filename in filenames:
             path = os.path.join(script_dir, filename)
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, (100, 100))
+            img = asset_loader.get(path, SPRITE_SIZE)
+            if img is None:
+                img = pygame.image.load(path).convert_alpha()
+                img = pygame.transform.scale(img, SPRITE_SIZE)
             frames.append(img)
     except (pygame.error, FileNotFoundError) as e:
         print(f"Warning: Could not load assets: {e}. Using placeholders.")
@@ -48,6 +63,10 @@ def load_button_images(path_base, scale=None):
     for state, suffix in suffixes.items():
         filename = f"{suffix}.png"
         full_path = os.path.join(path_base, filename)
+        preloaded = asset_loader.get(full_path, scale)
+        if preloaded is not None:
+            states[state] = preloaded
+            continue
         try:
             img = pygame.image.load(full_path).convert_alpha()
             if scale:
@@ -57,14 +76,18 @@ def load_button_images(path_base, scale=None):
             print(f"Warning: Could not load {full_path}: {e}")
             surf = pygame.Surface(scale, pygame.SRCALPHA)
             surf.fill((200, 50, 50))
-            font = pygame.font.Font(None, 24)
-            text_surf = font.render("Play", True, WHITE)
+            font = get_font(None, 24)
+            text_surf = render_text(font, "Play", WHITE)
             text_rect = text_surf.get_rect(center=(surf.get_width() // 2, surf.get_height() // 2))
             surf.blit(text_surf, text_rect)
             states[state] = surf
     return states
 
 def load_static_button(filename, scale=None):
+    preloaded = asset_loader.get(filename, scale)
+    if preloaded is not None:
+        return preloaded
+
     try:
         img = pygame.image.load(filename).convert_alpha()
         if scale:
@@ -74,8 +97,8 @@ def load_static_button(filename, scale=None):
         print(f"Warning: Could not load {filename}: {e}")
         surf = pygame.Surface(scale, pygame.SRCALPHA)
         surf.fill(LIGHT_PURPLE) 
-        font = pygame.font.Font(None, 24)
-        text_surf = font.render(filename.split('.')[0].capitalize().replace('_', ' '), True, GOLD)
+        font = get_font(None, 24)
+        text_surf = render_text(font, filename.split('.')[0].capitalize().replace('_', ' '), GOLD)
         text_rect = text_surf.get_rect(center=(surf.get_width() // 2, surf.get_height() // 2))
         surf.blit(text_surf, text_rect)
         return surf
@@ -148,25 +171,22 @@ class Button(pygame.sprite.Sprite):
                 self.image = self.states[self.current_state]
 
 class AnimatedEnemy(AnimatedSprite):
-    def __init__(self, frames, font, score, speed):
+    def __init__(self, frames, font, score, speed, problem=None):
         super().__init__(frames, random.randint(40, SCREEN_WIDTH - 140), -100, speed)
         self.font = font
-        self.question, self.answer = generate_problem(score)
+        self.question, self.answer = problem or generate_problem(score)
         
-        self.text_surf = self.font.render(self.question, True, TEXT_COLOR)
-        self.text_rect = self.text_surf.get_rect(center=(self.rect.centerx, self.rect.centery))
-
-    def update(self, dt):
-        super().update(dt)
-        self.text_rect.center = (self.rect.centerx, self.rect.centery)
-
-    def draw_text(self, screen):
-        box_padding = 5
-        box_rect = self.text_rect.inflate(box_padding * 2, box_padding * 2)
-        s = pygame.Surface(box_rect.size, pygame.SRCALPHA)
-        s.fill((0, 0, 0, 150))
-        screen.blit(s, box_rect.topleft)
-        screen.blit(self.text_surf, self.text_rect)
+        # Question text on its translucent box, baked into every animation
+        # frame; enemies with the same question share the composited frames.
+        # rect stays the size of the ship, which is what lasers and the loss
+        # line hit, however wide the question is.
+        self.labelled_frames = [labelled(frame, self.font, self.question, TEXT_COLOR, box=(5, (0, 0, 0, 150)))
+                                for frame in frames or [self.image]]
+
+    def blit(self):
+        """(surface, dest) drawing the current frame and question centred on rect."""
+        image = self.labelled_frames[self.frame_index]
+        return image, image.get_rect(center=self.rect.center)
 
 class Laser(AnimatedSprite):
     def __init__(self, frames, start_pos, target_pos):
@@ -188,31 +208,24 @@ class Laser(AnimatedSprite):
         self.rect = self.image.get_rect(center=self.rect.center)
 
     def update(self, dt):
-        self.rect.x += self.speed_x
-        self.rect.y += self.speed_y
+        self.prev_pos.update(self.pos)
+        scale = SPEED_FRAME_RATE * dt / 1000
+        self.move(self.speed_x * scale, self.speed_y * scale)
 
         self.animation_timer += dt
         if self.animation_timer >= self.animation_speed:
             self.animation_timer = 0
             if self.frames:
                 self.frame_index = (self.frame_index + 1) % len(self.frames)
-                self.image = self.original_frames[self.frame_index]
-                self.image = pygame.transform.rotate(self.image, self.rotation)
+                self.image = rotated(self.original_frames[self.frame_index], self.rotation)
         
         if not pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT).colliderect(self.rect):
             self.kill()
 
 class Explosion(AnimatedSprite):
     def __init__(self, frames, pos, scale=2):
-        # Scale the frames before passing them to the parent class
-        scaled_frames = []
-        if frames:
-            for frame in frames:
-                new_size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
-                scaled_frame = pygame.transform.scale(frame, new_size)
-                scaled_frames.append(scaled_frame)
-
-        super().__init__(scaled_frames, pos[0], pos[1])
+        # Scaled frame sets are shared between explosions
+        super().__init__(scaled_frames(frames, scale), pos[0], pos[1])
         self.animation_speed = 50
         self.one_time_animation_done = False
 
@@ -247,19 +260,20 @@ class LevelsSlideWindow:
     def create_buttons(self):
         button_y = 100
         for i in range(1, 7):
-            font = pygame.font.Font(None, 36)
-            text_surface = font.render(f"Level {i}", True, WHITE)
+            font = get_font(None, 36)
+            text_surface = render_text(font, f"Level {i}", WHITE)
             button = pygame.sprite.Sprite()
             button.image = text_surface
             button.rect = button.image.get_rect(center=(self.rect.centerx, button_y))
             self.buttons.append(button)
             button_y += 75
 
-    def update(self):
+    def update(self, dt):
+        slide = round(self.slide_speed * SPEED_FRAME_RATE * dt / 1000)
         if self.is_active and self.rect.x > SCREEN_WIDTH * 2 // 3:
-            self.rect.x -= self.slide_speed
+            self.rect.x -= slide
         elif not self.is_active and self.rect.x < SCREEN_WIDTH:
-            self.rect.x += self.slide_speed
+            self.rect.x += slide
     
     def draw(self, screen):
         if self.rect.x < SCREEN_WIDTH:
@@ -267,6 +281,8 @@ class LevelsSlideWindow:
             for button in self.buttons:
                 button.rect.centerx = self.rect.centerx
                 screen.blit(button.image, button.rect)
+            return self.rect
+        return None
     
     def handle_event(self, event):
         if self.is_active:
@@ -283,21 +299,52 @@ from ui import UI
 from input_box import InputBox
 
 class Game:
-    def __init__(self):
+    def __init__(self, headless_mode=False, script=None, mode="classic"):
+        # Headless runs draw to a dummy display with no audio and take their
+        # input from script, a headless.ScriptedInput
+        self.headless = headless_mode
+        self.script = script
+        if mode == "swarm" and swarm.np is None:
+            print("Warning: Swarm mode needs numpy, playing the classic mode instead")
+            mode = "classic"
+        self.mode = mode
+        self.swarm = None
+        if headless_mode:
+            headless.use_dummy_drivers()
         pygame.init()
-        self.screen = pygame.display.set_mode(SCREEN_SIZE)
+        if headless_mode:
+            audio.disable()
+        else:
+            audio.init()
+        if VSYNC:
+            # pygame only honours vsync for SCALED or OPENGL windows
+            self.screen = pygame.display.set_mode(SCREEN_SIZE, pygame.SCALED, vsync=1)
+        else:
+            self.screen = pygame.display.set_mode(SCREEN_SIZE)
         pygame.display.set_caption("Arithmetron")
+
+        # Staged startup: only the menu's images are decoded before the first
+        # frame. The game scene's keep loading behind the menu, a slice of
+        # each frame (poll_loading), and are built on first Play.
+        self.asset_cache = asset_loader.open_cache()
+        self.menu_loader = asset_loader.preload(asset_loader.menu_manifest(), workers=ASSET_LOAD_WORKERS,
+                                                use_processes=ASSET_LOAD_PROCESSES, cache=self.asset_cache)
+        if ASSET_LOAD_REPORT:
+            print("\n".join(self.menu_loader.report()))
+        self.game_loader = asset_loader.start_preload(asset_loader.game_manifest(), workers=ASSET_LOAD_WORKERS,
+                                                      use_processes=ASSET_LOAD_PROCESSES, cache=self.asset_cache)
+        self.game_scene_loaded = False
+
         self.clock = pygame.time.Clock()
         self.game_state = "menu"
         self.is_animation_finished = False
-        self.stars = [(random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)) for _ in range(120)]
+        self.starfield = Starfield(SCREEN_SIZE)
 
-        self.font_big = pygame.font.Font(None, 48)
-        self.font_med = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 18)
+        self.font_big = get_font(None, 48)
+        self.font_med = get_font(None, 24)
+        self.font_small = get_font(None, 18)
 
-        self.game_background_anim = AnimatedBackground('assets/background/in_game/', num_frames=26, animation_speed=50)
-        self.menu_background_anim = AnimatedBackground('assets/background/main/', num_frames=1, animation_speed=150)
+        self.menu_background_anim = AnimatedBackground(MENU_BACKGROUND_PATH, num_frames=MENU_BACKGROUND_FRAMES, animation_speed=150)
 
         # DO NOT REMOVE
 
@@ -315,15 +362,12 @@ class Game:
         # DO NOT REMOVE
 
         self.player_frames = load_frames(player_filenames, SHIP_COLOR, is_player=True)
-        self.enemy_frames = load_frames(enemy_filenames, ENEMY_COLOR, is_player=False)
-        self.explosion_frames = load_frames(explosion_filenames, (255, 165, 0), is_player=False)
-        self.laser_frames = load_frames(laser_filenames, (255, 50, 50), is_player=False)
         
-        self.play_button_size = (180, 120)
-        self.levels_button_size = (180, 40)
-        self.settings_button_size = (320, 40)
-        self.my_stats_button_size = (320, 40)
-        self.quit_button_size = (140, 40)
+        self.play_button_size = PLAY_BUTTON_SIZE
+        self.levels_button_size = LEVELS_BUTTON_SIZE
+        self.settings_button_size = SETTINGS_BUTTON_SIZE
+        self.my_stats_button_size = MY_STATS_BUTTON_SIZE
+        self.quit_button_size = QUIT_BUTTON_SIZE
         
         self.spaceship_initial_y = SCREEN_HEIGHT * 0.25 
         self.spaceship = AnimatedSprite(self.player_frames, SCREEN_WIDTH // 2, self.spaceship_initial_y)
@@ -332,18 +376,8 @@ class Game:
         self.buttons = pygame.sprite.Group()
         self.menu_buttons_y_start = self.spaceship_initial_y + 150 
         self.button_spacing = 105
+        self.load_menu_assets()
 
-        self.title_game_sprite = load_image(game_title_sprite)
-        self.title_game_scaled = pygame.transform.scale(self.title_game_sprite, (325, 100))
-        self.title_game_rect = self.title_game_scaled.get_rect(center=(SCREEN_WIDTH // 2,
-                                                                       SCREEN_HEIGHT * 0.12))
-        
-
-
-        """
-        self.title_surf = self.font_big.render("Arithmetron", True, GOLD)
-        self.title_rect = self.title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.12))
-        """
         self.spaceship_launch_speed = -9
         self.menu_animation_speed = 40
         
@@ -358,22 +392,11 @@ class Game:
         self.stage_to_complete = len(DIFFICULTY_STAGES)
 
         self.levels_window = LevelsSlideWindow()
-        self.settings_popup = SettingsPopup()
-        # Load sound effects once and hand them to SettingsPopup
-        self.sounds = {
-            'laser'    : pygame.mixer.Sound(laser_sfx),
-            'explosion': pygame.mixer.Sound(explosion_sfx),
-            'score'    : pygame.mixer.Sound(score_sfx),
-            'newlevel' : pygame.mixer.Sound(new_level_sfx),
-            'gameover' : pygame.mixer.Sound(game_over_sfx),
-            'hover'    : pygame.mixer.Sound(hover_sfx),
-            'gamewin'  : pygame.mixer.Sound(victory_sfx)
-        }
-        # Explosion is louder than score
-        self.sounds['explosion'].set_volume(self.settings_popup.sfx_volume * 1.8)
-        self.sounds['score'].set_volume(self.settings_popup.sfx_volume)
-        self.settings_popup.sounds = self.sounds
-        self.stats_popup = MyStatsPopup()
+        # Every sound effect, loaded once and shared with SettingsPopup
+        self.sounds = audio.SoundBank()
+        audio.retire_stale()
+        self.settings_popup = SettingsPopup(self.sounds)
+        self.stats_popup = MyStatsPopup(None if headless_mode else StatsStore())
         self.input_box = InputBox(
             x=(SCREEN_WIDTH - 200) // 2,
             y=SCREEN_HEIGHT - 50,
@@ -386,9 +409,22 @@ class Game:
         self.lasers = pygame.sprite.Group()
         self.explosions = pygame.sprite.Group()
         self.all_sprites = pygame.sprite.Group()
-        self.ui = UI()
-        self.staged_cleared = None
-        self.game_cleared = None
+        self.result_screen = None      # game over, stage or game cleared, while one is up
+        self.pause_overlay = None
+        self.pause_frame = None         # the paused scene under pause_overlay
+        self.renderer = DirtyRenderer(self.screen)
+        self.render_queue = RenderQueue(self.screen)
+        self.profiler = FrameProfiler()
+        self.pending_submit = None
+        # Answers are unique among the enemies on screen
+        self.problems = ProblemPool()
+        # Live enemies by answer, lowest first, for targeting and the loss line
+        self.answer_index = AnswerIndex()
+        self.enemy_grid = SpatialHash()
+        # Spawns run on simulation time rather than pygame.time.set_timer,
+        # so they keep pace with an uncapped headless run
+        self.spawn_interval = 0
+        self.spawn_timer = 0
         
         # Call the new function to create the UI
         self.create_menu_ui()
@@ -396,6 +432,65 @@ class Game:
         self.settings_popup.play_menu_music()
         self.last_hovered_button = None
 
+    def load_menu_assets(self):
+        """Title and button images, loaded once and reused every time the menu is rebuilt."""
+        self.title_game_sprite = load_image(game_title_sprite)
+        self.title_game_scaled = pygame.transform.scale(self.title_game_sprite, (325, 100))
+
+        """
+        self.title_surf = self.font_big.render("Arithmetron", True, GOLD)
+        self.title_rect = self.title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.12))
+        """
+        self.play_button_states = load_button_images(play_button_path, scale=self.play_button_size)
+        self.settings_img = load_static_button(settings_filename, scale=self.settings_button_size)
+        self.my_stats_img = load_static_button(my_stats_filename, scale=self.my_stats_button_size)
+        self.quit_img = load_static_button(quit_filename, scale=self.quit_button_size)
+
+    def poll_loading(self):
+        """Convert loaded game scene images for a slice of this frame, until there are none left."""
+        if not self.game_loader.done and self.game_loader.poll(STARTUP_LOAD_BUDGET_MS / 1000):
+            self.game_assets_loaded()
+
+    def game_assets_loaded(self):
+        """Every manifest is in: retire stale cache blobs and report the game scene's load."""
+        asset_loader.retire_stale(self.asset_cache)
+        if ASSET_LOAD_REPORT:
+            print("\n".join(self.game_loader.report()))
+
+    def load_game_scene(self):
+        """Build the game scene on first need; it is kept for every later game."""
+        if self.game_scene_loaded:
+            return
+        if not self.game_loader.done:
+            self.game_loader.finish()
+            self.game_assets_loaded()
+
+        encoded_background = load_index(GAME_BACKGROUND_ENCODED_PATH)
+        if BACKGROUND_STREAMING:
+            self.game_background_anim = StreamingBackground(GAME_BACKGROUND_PATH, num_frames=GAME_BACKGROUND_FRAMES,
+                                                            animation_speed=50, cache=self.asset_cache)
+        elif encoded_background:
+            self.game_background_anim = DeltaBackground(GAME_BACKGROUND_ENCODED_PATH, animation_speed=50,
+                                                        index=encoded_background)
+        else:
+            self.game_background_anim = AnimatedBackground(GAME_BACKGROUND_PATH, num_frames=GAME_BACKGROUND_FRAMES, animation_speed=50)
+
+        self.enemy_frames = load_frames(enemy_filenames, ENEMY_COLOR, is_player=False)
+        self.explosion_frames = load_frames(explosion_filenames, (255, 165, 0), is_player=False)
+        self.laser_frames = load_frames(laser_filenames, (255, 50, 50), is_player=False)
+        self.ui = UI()
+        self.game_scene_loaded = True
+
+    def draw_loading_bar(self):
+        """Progress of the game scene loading behind the menu; returns the rect drawn."""
+        bar = pygame.Rect(0, 0, 200, 6)
+        bar.midbottom = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 20)
+        pygame.draw.rect(self.screen, LIGHT_PURPLE, bar)
+        filled = bar.copy()
+        filled.width = int(bar.width * self.game_loader.progress)
+        pygame.draw.rect(self.screen, GOLD, filled)
+        return bar
+
     def create_menu_buttons(self, button_data):
         for i, (item, image_data, action) in enumerate(button_data):
             y_position = self.menu_buttons_y_start + i * self.button_spacing
@@ -411,8 +506,10 @@ class Game:
                 button.action = action
     
     def reset_game(self):
+        self.load_game_scene()
         self.game_state = "play"
         self.game_over = False
+        self.result_screen = None
         self.paused = False
         self.victory = False
         self.score = 0
@@ -425,25 +522,104 @@ class Game:
         self.lasers.empty()
         self.explosions.empty()
         self.all_sprites.empty()
+        self.problems.reset()
+        self.answer_index.clear()
+        self.enemy_grid.clear()
+        if self.mode == "swarm":
+            if self.swarm is None:
+                self.swarm = EnemySwarm(self.enemy_frames, self.font_big)
+            self.swarm.clear()
         self.enemies_spawned_in_stage = 0
         
         self.player = AnimatedSprite(self.player_frames, SCREEN_WIDTH // 2, SCREEN_HEIGHT - 120)
         self.all_sprites.add(self.player)
         
         self.current_stage = DIFFICULTY_STAGES[self.current_stage_index]
-        pygame.time.set_timer(SPAWN_EVENT, self.current_stage["spawn_interval"])
+        if self.mode == "swarm":
+            self.set_spawn_interval(SWARM_SPAWN_INTERVAL)
+        else:
+            self.set_spawn_interval(self.current_stage["spawn_interval"])
         
         self.settings_popup.play_menu_music()
 
+    def set_spawn_interval(self, interval):
+        """Post SPAWN_EVENT every interval ms of simulated time; 0 stops it."""
+        self.spawn_interval = interval
+        self.spawn_timer = 0
+
+    def update_spawn_timer(self, dt):
+        if not self.spawn_interval:
+            return
+        self.spawn_timer += dt
+        if self.spawn_timer >= self.spawn_interval:
+            # Like set_timer, missed intervals collapse into a single event
+            self.spawn_timer %= self.spawn_interval
+            pygame.event.post(pygame.event.Event(SPAWN_EVENT))
+
+    def play_button_position(self):
+        for button in self.buttons:
+            if isinstance(button, Button):
+                return button.rect.center
+        return (SCREEN_WIDTH // 2, self.menu_buttons_y_start)
+
+    def lowest_enemy(self):
+        """The enemy closest to the bottom of the screen, or None."""
+        return self.answer_index.lowest()
+
+    def lowest_answer(self):
+        """Answer of the enemy closest to the bottom in either mode, or None."""
+        if self.mode == "swarm":
+            i = self.swarm.lowest()
+            return None if i is None else int(self.swarm.answer[i])
+        enemy = self.lowest_enemy()
+        return None if enemy is None else enemy.answer
+
+    def spawn_enemies(self):
+        if self.mode == "swarm":
+            for _ in range(SWARM_SPAWN_BATCH):
+                self.swarm.spawn(random.randint(90, SCREEN_WIDTH - 90), -100, SWARM_ENEMY_SPEED,
+                                 self.problems.draw(self.score))
+        elif self.enemies_spawned_in_stage < self.current_stage["enemies_to_clear"]:
+            e = AnimatedEnemy(self.enemy_frames, self.font_big, self.score, self.current_stage["enemy_speed"],
+                              self.problems.draw(self.score))
+            self.add_enemy(e)
+            self.enemies_spawned_in_stage += 1
+
+    def collide_swarm(self):
+        """Kill every laser that hit the swarm; returns the centres of the enemies destroyed."""
+        hits = self.swarm.collide(self.lasers.sprites())
+        indices = []
+        for laser, hit in hits.items():
+            laser.kill()
+            indices += hit
+        centres = [self.swarm.center(i) for i in indices]
+        for answer in self.swarm.remove(indices):
+            self.problems.release(answer)
+        return centres
+
+    def add_enemy(self, enemy):
+        # Enemies are updated and drawn apart from all_sprites, see AnimatedEnemy.blit
+        self.enemies.add(enemy)
+        self.answer_index.add(enemy)
+        self.enemy_grid.insert(enemy)
+
+    def remove_enemy(self, enemy):
+        """Take an enemy out of play, whether it was destroyed or got past."""
+        enemy.kill()
+        self.answer_index.remove(enemy)
+        self.enemy_grid.remove(enemy)
+        self.problems.release(enemy.answer)
+
     def update_menu_animation(self, dt):
-        self.title_game_rect.y += self.menu_animation_speed
+        scale = SPEED_FRAME_RATE * dt / 1000
+        menu_step = round(self.menu_animation_speed * scale)
+        self.title_game_rect.y += menu_step
         for button in self.buttons:
             if isinstance(button, Button):
                  button.update()
-            button.rect.y += self.menu_animation_speed
+            button.rect.y += menu_step
         
-        self.spaceship_group.update(dt)
-        self.spaceship.rect.y += self.spaceship_launch_speed
+        self.spaceship.move(0, self.spaceship_launch_speed * scale)
 
         if self.spaceship.rect.bottom <= 0:
             self.settings_popup.stop_music()
@@ -452,7 +628,7 @@ class Game:
     def start_play_animation(self):
         self.game_state = "play_animation"
         self.is_animation_finished = False
-        self.spaceship.rect.center = (SCREEN_WIDTH // 2, self.spaceship_initial_y) 
+        self.spaceship.set_position((SCREEN_WIDTH // 2, self.spaceship_initial_y))
         self.title_game_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.12)
         for i, button in enumerate(self.buttons):
             if isinstance(button, Button):
@@ -474,6 +650,9 @@ class Game:
             self.settings_popup.is_active = False
         
     def quit_game(self):
+        self.stats_popup.close()
+        if CACHE_REPORT:
+            print("\n".join(transform_cache.report()))
         pygame.quit()
         sys.exit()
     
@@ -483,6 +662,14 @@ class Game:
             if event.type == pygame.QUIT:
                 self.quit_game()
 
+            if event.type == pygame.WINDOWEXPOSED:
+                self.renderer.invalidate()
+
+            if event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                self.profiler.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == PROFILER_DUMP_KEY:
+                print(f"Frame profile written to {self.profiler.dump_csv()}")
+
             if self.settings_popup.is_active:
                 self.settings_popup.handle_event(event)
 
@@ -490,6 +677,7 @@ class Game:
             if self.game_state == "play" and not self.game_over:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
                     self.paused = not self.paused
+                    self.pause_frame = None
                     return submitted_text
             
             if self.game_state == "menu":
@@ -527,11 +715,8 @@ class Game:
 
             elif self.game_state == "play" and not self.game_over and not self.paused:
                 submitted_text = self.input_box.handle_event(event)
-                if event.type == SPAWN_EVENT and self.enemies_spawned_in_stage < self.current_stage["enemies_to_clear"]:
-                    e = AnimatedEnemy(self.enemy_frames, self.font_big, self.score, self.current_stage["enemy_speed"])
-                    self.enemies.add(e)
-                    self.all_sprites.add(e)
-                    self.enemies_spawned_in_stage += 1
+                if event.type == SPAWN_EVENT:
+                    self.spawn_enemies()
 
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.return_to_menu()
@@ -563,7 +748,8 @@ class Game:
                 self.victory = True
                 self.input_box.active = False
                 self.create_game_completion()
-                pygame.time.set_timer(SPAWN_EVENT, 0)  # Stop spawning enemies
+                self.set_spawn_interval(0)  # Stop spawning enemies
+                self.sounds.play('gamewin')
             else:
                 # Stage cleared but more stages remain
                 self.game_state = "level_cleared"
@@ -572,7 +758,8 @@ class Game:
                    "annihilated": 0
                  })
                 self.create_stage_completion()
-                pygame.time.set_timer(SPAWN_EVENT, 0)  # Stop spawning enemies temporarily
+                self.set_spawn_interval(0)  # Stop spawning enemies temporarily
+                self.sounds.play('gamewin')
 
     def proceed_to_next_stage(self):
         """Proceed to the next stage after level cleared screen"""
@@ -582,8 +769,9 @@ class Game:
         
         if self.current_stage_index < len(DIFFICULTY_STAGES):
             self.current_stage = DIFFICULTY_STAGES[self.current_stage_index]
-            pygame.time.set_timer(SPAWN_EVENT, self.current_stage["spawn_interval"])
+            self.set_spawn_interval(self.current_stage["spawn_interval"])
             self.game_state = "play"  # Return to play state
+            self.result_screen = None
             self.input_box.active = True  # Reactivate input
 
     def create_menu_ui(self):
@@ -591,27 +779,14 @@ class Game:
         self.spaceship = AnimatedSprite(self.player_frames, SCREEN_WIDTH // 2, self.spaceship_initial_y)
         self.spaceship_group.add(self.spaceship)
 
-        self.title_game_sprite = load_image(game_title_sprite)
-        self.title_game_scaled = pygame.transform.scale(self.title_game_sprite, (325, 100))
         self.title_game_rect = self.title_game_scaled.get_rect(center=(SCREEN_WIDTH // 2,
                                                                        SCREEN_HEIGHT * 0.12))
 
-        """
-        self.title_surf = self.font_big.render("Arithmetron", True, GOLD)
-        self.title_rect = self.title_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT * 0.12))
-        """
-        button_path = "assets/ui_ux/play_button"
-        play_button_states = load_button_images(button_path, scale=self.play_button_size)
-        levels_img   = load_static_button(levels_filename, scale=self.levels_button_size)
-        settings_img = load_static_button(settings_filename, scale=self.settings_button_size)
-        my_stats_img = load_static_button(my_stats_filename, scale=self.my_stats_button_size)
-        quit_img     = load_static_button(quit_filename, scale=self.quit_button_size)
-
         button_data = [
-            ("Play", play_button_states, self.start_play_animation),
-            ("Settings", settings_img, self.toggle_settings),
-            ("My Stats", my_stats_img, self.toggle_stats),
-            ("Quit", quit_img, self.quit_game)
+            ("Play", self.play_button_states, self.start_play_animation),
+            ("Settings", self.settings_img, self.toggle_settings),
+            ("My Stats", self.my_stats_img, self.toggle_stats),
+            ("Quit", self.quit_img, self.quit_game)
         ]
         self.create_menu_buttons(button_data)
 
@@ -619,193 +794,337 @@ class Game:
     def return_to_menu(self):
         self.game_state = "menu"
         self.game_over = False
+        self.result_screen = None
         self.paused = False
         self.victory = False
         
         # Use the same button sizes as __init__
-        self.play_button_size = (180, 120)
-        self.levels_button_size = (180, 40)
-        self.settings_button_size = (320, 40)
-        self.my_stats_button_size = (320, 40)
-        self.quit_button_size = (140, 40)
+        self.play_button_size = PLAY_BUTTON_SIZE
+        self.levels_button_size = LEVELS_BUTTON_SIZE
+        self.settings_button_size = SETTINGS_BUTTON_SIZE
+        self.my_stats_button_size = MY_STATS_BUTTON_SIZE
+        self.quit_button_size = QUIT_BUTTON_SIZE
 
         self.create_menu_ui()
         self.settings_popup.play_menu_music()
 
+    # The result screens freeze the next frame drawn, see Game.freeze
     def create_stage_completion(self):
-        self.staged_cleared = StageCleared(
-            self.game_background,
-            self.stars,
-            self.all_sprites,
-            self.score
-        )
+        self.result_screen = result_screen.stage_cleared(self.score)
 
     def create_game_completion(self):
-        self.game_cleared = GameCleared(
-            self.game_background,
-            self.stars,
-            self.all_sprites,
-            self.score
-        )
+        self.result_screen = result_screen.game_cleared(self.score)
     
     def create_game_over(self):
-        self.game_over_screen = GameOver(
-            self.game_background,
-            self.stars,
-            self.all_sprites,
-            self.score
-        )
-
-    def run(self):
-        while True:
-            dt = self.clock.tick(FPS)
-            submitted_text = self.handle_events()
+        self.result_screen = result_screen.game_over(self.score)
 
-            # Update the backgrounds based on the game state
-            if self.game_state == "menu" or self.game_state == "play_animation":
-                self.menu_background_anim.update(dt)
-                self.screen.blit(self.menu_background_anim.get_current_frame(), (0, 0))
-                surface_blit(self.title_game_scaled, self.title_game_rect)
-                self.spaceship_group.update(dt)
-                self.spaceship_group.draw(self.screen)
-            else: # "play", "game_cleared", "level_cleared"
-                self.game_background_anim.update(dt)
-                self.screen.blit(self.game_background_anim.get_current_frame(), (0, 0))
-                self.stars = draw_stars(self.screen, self.stars, SCREEN_HEIGHT)
+    @property
+    def frozen(self):
+        """The frozen frame under a result screen or the pause overlay, once there is one."""
+        if self.result_screen is not None:
+            return self.result_screen.frame
+        return self.pause_frame if self.paused else None
 
-            if self.game_state == "menu":
-                for button in self.buttons:
-                    if isinstance(button, Button):
-                        button.update()
-                self.buttons.draw(self.screen)
-
-                self.levels_window.update()
-                self.levels_window.draw(self.screen)
-                self.settings_popup.display()
-                self.stats_popup.display()
-
-                self.settings_popup.current_music = self.game_state
-            
-            elif self.game_state == "play_animation":
-                self.update_menu_animation(dt) 
-                
-                self.buttons.draw(self.screen)
-                self.spaceship_group.draw(self.screen)
+    def freeze(self):
+        """
+        Keep the frame just drawn, under the result screen or pause overlay,
+        as the background while it is up. Called before the profiler draws,
+        so its overlay never ends up in the frozen frame.
+        """
+        if self.result_screen is not None:
+            self.result_screen.freeze(self.screen)
+        else:
+            if self.pause_overlay is None:
+                self.pause_overlay = result_screen.compose_overlay(SCREEN_SIZE, (0, 0, 0, 128), [
+                    (self.font_big, "PAUSED", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)),
+                    (self.font_med, "Press P to Resume", TEXT_COLOR, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)),
+                ])
+            self.pause_frame = self.screen.copy()
+            self.pause_frame.blit(self.pause_overlay, (0, 0))
+        self.screen.blit(self.frozen, (0, 0))
+        self.renderer.invalidate()
+
+    def step(self, dt):
+        """Advance the simulation by one fixed step of dt milliseconds."""
+        submitted_text, self.pending_submit = self.pending_submit, None
+
+        if self.game_state == "menu" or self.game_state == "play_animation":
+            self.spaceship_group.update(dt)
+        else: # "play", "game_cleared", "level_cleared"
+            self.starfield.update(dt)
+
+        if self.game_state == "menu":
+            for button in self.buttons:
+                if isinstance(button, Button):
+                    button.update()
+            self.levels_window.update(dt)
+            self.settings_popup.current_music = self.game_state
+
+        elif self.game_state == "play_animation":
+            self.update_menu_animation(dt)
+
+        elif self.game_state == "play":
+            self.settings_popup.play_game_music()
+            if not self.game_over and not self.paused:
+                self.update_spawn_timer(dt)
+                self.all_sprites.update(dt)
+                self.enemies.update(dt)
+                self.answer_index.advance(dt)
+                self.enemy_grid.refresh()
+                if self.mode == "swarm":
+                    self.swarm.update(dt)
+                self.input_box.update(dt)
                 
-                if self.spaceship.rect.bottom <= 0:
-                    self.reset_game()
-            
-            elif self.game_state == "play":
-                self.settings_popup.play_game_music()
-                if not self.game_over and not self.paused:
-                    self.all_sprites.update(dt)
-                    self.input_box.update(dt)
+                if submitted_text is not None:
+                    try:
+                        typed_val = int(submitted_text)
+                    except ValueError:
+                        typed_val = None
                     
-                    if submitted_text is not None:
-                        try:
-                            typed_val = int(submitted_text)
-                        except ValueError:
-                            typed_val = None
-                        
-                        if typed_val is not None:
-                            matched = None
-                            closest_y = -1
-                            for e in self.enemies:
-                                if typed_val == e.answer and e.rect.y > closest_y:
-                                    closest_y = e.rect.y
-                                    matched = e
-                            if matched:
-                                self.player.rotate_to(matched.rect.center)
-                                laser = Laser(self.laser_frames, self.player.rect.center, matched.rect.center)
-                                self.lasers.add(laser)
-                                self.all_sprites.add(laser)
-                                self.sounds['laser'].play()
-
-                    # Handle Hits for hitting enemy
-                    hits = pygame.sprite.groupcollide(self.lasers, self.enemies, True, True)
-                    
-                    all_enemies_hit = [enemy for enemies_list in hits.values() for enemy in enemies_list]
-                    unique_enemies = set(all_enemies_hit)
-
+                    target = None
+                    if typed_val is not None and self.mode == "swarm":
+                        i = self.swarm.lowest(typed_val)
+                        if i is not None:
+                            target = self.swarm.center(i)
+                    elif typed_val is not None:
+                        matched = self.answer_index.lowest(typed_val)
+                        if matched:
+                            target = matched.rect.center
+                    if target is not None:
+                        self.player.rotate_to(target)
+                        laser = Laser(self.laser_frames, self.player.rect.center, target)
+                        self.lasers.add(laser)
+                        self.all_sprites.add(laser)
+                        self.sounds.play('laser')
+
+                # Handle Hits for hitting enemy
+                collide_start = time.perf_counter()
+                if self.mode == "swarm":
+                    destroyed = self.collide_swarm()
+                else:
+                    hits = collision.groupcollide(self.lasers, self.enemy_grid, True, True)
+                    unique_enemies = set(enemy for enemies_list in hits.values() for enemy in enemies_list)
+                    destroyed = []
                     for enemy in unique_enemies:
-                        explosion = Explosion(self.explosion_frames, enemy.rect.center)
-                        self.explosions.add(explosion)
-                        self.all_sprites.add(explosion)
-                        
-                        self.score += 10
-                        self.enemies_cleared_in_stage += 1
-                        self.stats_popup.update({
-                            "highest_level": self.current_stage_index + 1,
-                            "annihilated": 1
-                        })
-                        self.sounds['explosion'].play()
-                        self.sounds['score'].play()
+                        self.remove_enemy(enemy)
+                        destroyed.append(enemy.rect.center)
+                self.profiler.lap("collide", collide_start)
+
+                for centre in destroyed:
+                    explosion = Explosion(self.explosion_frames, centre)
+                    self.explosions.add(explosion)
+                    self.all_sprites.add(explosion)
                     
-                    self.check_stage_completion()
-
-                    # Handles Losing Life
-                    for e in list(self.enemies):
-                        if e.rect.bottom >= SCREEN_HEIGHT - 60:
-                            self.enemies.remove(e)
-                            self.all_sprites.remove(e)
-                            self.ui.lose_life()
-                            self.lives = self.ui.lives
-                            self.input_box.text = ""
-                            self.enemies_spawned_in_stage -= 1
-                            if self.lives <= 0:
-                                self.game_over = True
-                                self.create_game_over()
-                                self.input_box.active = False
-                                self.sounds['gameover'].play()
+                    self.score += 10
+                    self.enemies_cleared_in_stage += 1
+                    self.stats_popup.update({
+                        "highest_level": self.current_stage_index + 1,
+                        "annihilated": 1
+                    })
+                    self.sounds.play('explosion')
+                    self.sounds.play('score')
                 
-                pygame.draw.line(self.screen, (60, 80, 120), (0, SCREEN_HEIGHT - 60), (SCREEN_WIDTH, SCREEN_HEIGHT - 60), 2)
-                self.all_sprites.draw(self.screen)
-                self.input_box.draw(self.screen)
-                
-                for enemy in self.enemies:
-                    enemy.draw_text(self.screen)
-
-                self.ui.display(stage_number=self.current_stage_index + 1, score=self.score)
+                if self.mode == "swarm":
+                    # Swarm mode has no stages; it runs until the lives are gone
+                    escaped = self.swarm.crossed(SCREEN_HEIGHT - 60)
+                    for answer in self.swarm.remove(escaped):
+                        self.problems.release(answer)
+                else:
+                    self.check_stage_completion()
+                    escaped = self.answer_index.crossed(SCREEN_HEIGHT - 60)
+                    for e in escaped:
+                        self.remove_enemy(e)
+
+                # Handles Losing Life
+                for _ in range(len(escaped)):
+                    if self.game_over:
+                        break
+                    self.ui.lose_life()
+                    self.lives = self.ui.lives
+                    self.input_box.text = ""
+                    self.enemies_spawned_in_stage -= 1
+                    if self.lives <= 0:
+                        self.game_over = True
+                        self.create_game_over()
+                        self.input_box.active = False
+                        self.sounds.play('gameover')
+
+    def render(self, dt, alpha):
+        """
+        Draw the current state; dt is the real frame time in milliseconds.
 
-                if self.paused:
-                    pause_overlay = pygame.Surface(SCREEN_SIZE, pygame.SRCALPHA)
-                    pause_overlay.fill((0, 0, 0, 128))
-                    self.screen.blit(pause_overlay, (0, 0))
-                    
-                    pause_text = self.font_big.render("PAUSED", True, WHITE)
-                    pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                    self.screen.blit(pause_text, pause_rect)
-                    
-                    resume_text = self.font_med.render("Press P to Resume", True, TEXT_COLOR)
-                    resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-                    self.screen.blit(resume_text, resume_rect)
-                elif self.game_over:
-                    self.game_over_screen.display()
-                    self.game_over_screen.update(dt)
+        alpha is how far the simulation has run into the next fixed step,
+        used to interpolate sprite positions between the last two steps.
+        """
+        renderer = self.renderer
+        profiler = self.profiler
+        t = time.perf_counter()
+        if self.game_state == "menu" or self.game_state == "play_animation":
+            self.menu_background_anim.update(dt)
+            renderer.begin(self.menu_background_anim.get_current_frame(), scene=self.game_state,
+                           changed=getattr(self.menu_background_anim, 'dirty_rects', None))
+            renderer.mark(surface_blit(self.title_game_scaled, self.title_game_rect))
+            self.spaceship.interpolate(alpha)
+            self.draw_group(self.spaceship_group)
+        elif self.frozen is not None:
+            # Nothing moves under a result screen or while paused, so the
+            # frozen frame is the background and only what is drawn over it
+            # gets presented
+            renderer.begin(self.frozen, scene=self.game_state)
+        else: # "play"
+            self.game_background_anim.update(dt)
+            renderer.begin(self.game_background_anim.get_current_frame(), scene=self.game_state,
+                           changed=getattr(self.game_background_anim, 'dirty_rects', None))
+            renderer.mark_all(self.starfield.draw(self.screen))
+        t = profiler.lap("background", t)
+
+        if self.game_state == "menu":
+            self.draw_group(self.buttons)
+            t = profiler.lap("draw", t)
+
+            renderer.mark(self.levels_window.draw(self.screen))
+            renderer.mark(self.settings_popup.display())
+            renderer.mark(self.stats_popup.display())
+            if not self.game_loader.done:
+                renderer.mark(self.draw_loading_bar())
+        
+        elif self.game_state == "play_animation":
+            self.draw_group(self.buttons)
+            self.draw_group(self.spaceship_group)
+        
+        elif self.frozen is None: # "play", or a result screen still to freeze
+            # Sprites only move while the simulation runs
+            if self.paused or self.result_screen is not None:
+                alpha = 1
+            for sprite in self.all_sprites:
+                sprite.interpolate(alpha)
+            for enemy in self.enemies:
+                enemy.interpolate(alpha)
+
+            renderer.mark(pygame.draw.line(self.screen, (60, 80, 120), (0, SCREEN_HEIGHT - 60), (SCREEN_WIDTH, SCREEN_HEIGHT - 60), 2))
+            # Enemies and sprites go out as one blits call, then the HUD as
+            # another, so the profiler can tell the two apart
+            queue = self.render_queue
+            visible = renderer.screen_rect.colliderect
+            queue.extend([blit for blit in map(AnimatedEnemy.blit, self.enemies) if visible(blit[1])])
+            queue.add_sprites(self.all_sprites)
+            if self.mode == "swarm":
+                self.swarm.draw(queue, alpha)
+            renderer.mark_all(queue.flush())
+            t = profiler.lap("draw", t)
+            queue.extend(self.ui.blits(stage_number=self.current_stage_index + 1, score=self.score), LAYER_HUD)
+            renderer.mark_all(queue.flush())
+            renderer.mark(self.input_box.draw(self.screen))
+
+            if self.paused or self.result_screen is not None:
+                self.freeze()
+
+        renderer.mark(profiler.draw(self.screen))
+        t = profiler.lap("hud", t)
+        renderer.present()
+        profiler.lap("present", t)
+
+    def draw_group(self, group):
+        """Draw a sprite group and mark it; Group.draw itself reports no rects."""
+        self.render_queue.add_sprites(group)
+        self.renderer.mark_all(self.render_queue.flush())
+
+    def update_hover_sound(self):
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = None
+        for button in self.buttons:
+            if isinstance(button, Button) and button.rect.collidepoint(mouse_pos):
+                hovered = button
+                break
+        if hovered and hovered is not self.last_hovered_button:
+            self.sounds.play('hover')
+        self.last_hovered_button = hovered
+
+    def run(self, max_frames=None):
+        """
+        Fixed-timestep loop: the simulation always advances in steps of
+        1000 / SIM_HZ ms, however fast frames are rendered, and the clock
+        tick at the top is the only place the loop waits.
+
+        A headless game never waits: every frame advances exactly one step,
+        so the simulation runs as fast as the machine allows. max_frames
+        ends the run after that many frames, returning the number of
+        simulated frames per wall-clock second.
+        """
+        step_ms = 1000 / SIM_HZ
+        accumulator = 0
+        tick = self.clock.tick_busy_loop if PRECISE_PACING else self.clock.tick
+        profiler = self.profiler
+        frame = 0
+        started = frame_start = time.perf_counter()
+
+        while max_frames is None or frame < max_frames:
+            t = time.perf_counter()
+            if self.headless:
+                frame_ms = step_ms
+                if self.script is not None:
+                    self.script.feed(self, frame)
+            else:
+                frame_ms = tick(0 if VSYNC else FPS)
+            t = profiler.lap("idle", t)
+            # After a stall, drop the time beyond MAX_CATCH_UP_STEPS instead
+            # of spiralling into ever longer catch-up frames
+            accumulator += min(frame_ms, step_ms * MAX_CATCH_UP_STEPS)
 
-            elif self.game_state == "game_cleared":
-                self.sounds['gamewin'].play()
-                self.game_cleared.display()
-                self.game_cleared.update(dt)
+            submitted_text = self.handle_events()
+            if submitted_text is not None:
+                self.pending_submit = submitted_text
+            if not self.headless:
+                self.update_hover_sound()
+            t = profiler.lap("events", t)
+
+            while accumulator >= step_ms:
+                self.step(step_ms)
+                accumulator -= step_ms
+            profiler.lap("update", t)
+
+            self.render(frame_ms, accumulator / step_ms)
+            t = time.perf_counter()
+            self.poll_loading()
+            profiler.lap("load", t)
+            frame += 1
+
+            now = time.perf_counter()
+            profiler.end_frame(now - frame_start)
+            frame_start = now
+
+        elapsed = time.perf_counter() - started
+        frames_per_second = frame / elapsed if elapsed else 0
+        print(f"{frame} frames in {elapsed:.2f} s: {frames_per_second:.0f} frames/s, "
+              f"{frame * step_ms / 1000 / elapsed if elapsed else 0:.1f}x real time")
+        return frames_per_second
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Arithmetron")
+    parser.add_argument("--headless", action="store_true",
+                        help="no window or audio, simulate as fast as possible")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    parser.add_argument("--script", help="JSON input script for a headless run")
+    parser.add_argument("--autoplay", action="store_true", help="answer enemies automatically in a headless run")
+    parser.add_argument("--seed", type=int, default=None, help="seed the random generator for repeatable runs")
+    parser.add_argument("--mode", choices=("classic", "swarm"), default="classic",
+                        help="swarm: an endless stream of enemies, for stress testing (needs numpy)")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    script = None
+    if args.script:
+        script = headless.ScriptedInput.load(args.script, autoplay=args.autoplay)
+    elif args.autoplay:
+        script = headless.ScriptedInput(autoplay=True)
+
+    game = Game(headless_mode=args.headless, script=script, mode=args.mode)
+    game.run(args.frames)
+    game.quit_game()
 
-            elif self.game_state == "level_cleared":
-                self.sounds['gamewin'].play()
-                self.staged_cleared.display()
-                self.staged_cleared.update(dt)
 
-            # ---- global hover sound logic ----
-            mouse_pos = pygame.mouse.get_pos()
-            hovered = None
-            for button in self.buttons:
-                if isinstance(button, Button) and button.rect.collidepoint(mouse_pos):
-                    hovered = button
-                    break
-            if hovered and hovered is not self.last_hovered_button:
-                self.settings_popup.sounds['hover'].play()
-            self.last_hovered_button = hovered
-
-            pygame.display.flip()
-            self.clock.tick(FPS)
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    main()
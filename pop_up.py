@@ -1,22 +1,12 @@
 import pygame as py
+import audio
 
-from support import surface_blit, load_image, load_font, draw_ui_sprite
+from support import surface_blit, load_image, load_font, draw_ui_sprite, render_text
 from settings import *
 from stats import *
 
 class SettingsPopup():
-    def _init_sounds(self):
-        self.sounds = {
-            'laser'    : pygame.mixer.Sound(laser_sfx),
-            'explosion': pygame.mixer.Sound(explosion_sfx),
-            'score'    : pygame.mixer.Sound(score_sfx),
-            'newlevel' : pygame.mixer.Sound(new_level_sfx),
-            'gameover' : pygame.mixer.Sound(game_over_sfx),
-            'hover'    : pygame.mixer.Sound(hover_sfx),
-            'gamewin'  : pygame.mixer.Sound(victory_sfx)
-        }
-
-    def __init__(self):
+    def __init__(self, sounds=None):
         self.display_surface = py.display.get_surface()
 
         self.background_sprite = load_image(settings_background)
@@ -38,12 +28,15 @@ class SettingsPopup():
 
         self.is_active = False
 
+        # Area covered by the tab background while the popup is open
+        self.draw_rect = py.Rect(0, 0, self.display_surface.get_width() // 2 + 75,
+                                 self.display_surface.get_height() // 2 + 200)
+        self.draw_rect.center = self.display_surface.get_rect().center
+
         self.font = load_font(FONT, FONT_SIZE)
 
         self.music_volume = 0.3  
-        self.sfx_volume = 0.5    
         self.music_enabled = True
-        self.sfx_enabled = True
         
         # Current music state
         self.current_music = None  
@@ -57,14 +50,21 @@ class SettingsPopup():
         self.dragging_music = False
         self.dragging_sfx = False
         
-        if not py.mixer.get_init():
-            py.mixer.init()
+        audio.init()
+
+        # The effects' volume and mute state live in the SoundBank
+        self.sounds = sounds if sounds is not None else audio.SoundBank()
+
+    @property
+    def sfx_volume(self):
+        return self.sounds.volume
 
-        self.sounds = {}
-        self._init_sounds()
+    @property
+    def sfx_enabled(self):
+        return not self.sounds.muted
     
     def play_menu_music(self):
-        if self.music_enabled and menu_bgm:
+        if self.music_enabled and menu_bgm and py.mixer.get_init():
             try:
                 if self.current_music != "menu":
                     py.mixer.music.load(menu_bgm)
@@ -75,7 +75,7 @@ class SettingsPopup():
                 print(f"Warning: Could not load menu music: {e}")
 
     def play_game_music(self):
-        if self.music_enabled and game_bgm:
+        if self.music_enabled and game_bgm and py.mixer.get_init():
             try:
                 if self.current_music != "play":
                     py.mixer.music.load(game_bgm)
@@ -86,36 +86,29 @@ class SettingsPopup():
                 print(f"Warning: Could not load game music: {e}")
 
     def stop_music(self):
-        py.mixer.music.stop()
+        if py.mixer.get_init():
+            py.mixer.music.stop()
         self.current_music = None
 
     def set_music_volume(self, volume):
         self.music_volume = max(0.0, min(1.0, volume))
-        if py.mixer.music.get_busy():
+        if py.mixer.get_init() and py.mixer.music.get_busy():
             py.mixer.music.set_volume(self.music_volume)
 
     def set_sfx_volume(self, volume):
-        self.sfx_volume = max(0.0, min(1.0, volume))
-        for key, snd in self.sounds.items():
-            if key == 'explosion':
-                snd.set_volume(self.sfx_volume * 1.8)
-            else:
-                snd.set_volume(self.sfx_volume)
+        self.sounds.set_volume(volume)
 
     def toggle_music(self):
         self.music_enabled = not self.music_enabled
+        if not py.mixer.get_init():
+            return
         if not self.music_enabled:
             py.mixer.music.pause()
         else:
             py.mixer.music.unpause()
 
     def toggle_sfx(self):
-        self.sfx_enabled = not self.sfx_enabled
-        if not self.sfx_enabled:
-            for sound in self.sounds.values():
-                sound.set_volume(0)  # Mute all sounds
-        else:
-            self.set_sfx_volume(self.sfx_volume)
+        self.sounds.set_muted(not self.sounds.muted)
 
     def handle_event(self, event):
         if not self.is_active:
@@ -245,7 +238,7 @@ class SettingsPopup():
             )
 
             font = self.font['med']
-            volume_text = font.render(f"{int(volume * 100)}%", True, WHITE)
+            volume_text = render_text(font, f"{int(volume * 100)}%", WHITE)
             volume_rect = volume_text.get_rect(center=(
                 bar_pos_x + bar_size[0] // 2 + 20,
                 bar_pos_y
@@ -257,7 +250,7 @@ class SettingsPopup():
             font = self.font['med']
             
             music_color = GREEN if self.music_enabled else RED
-            music_text = font.render("Music: ON" if self.music_enabled else "Music: OFF", True, music_color)
+            music_text = render_text(font, "Music: ON" if self.music_enabled else "Music: OFF", music_color)
             music_rect = music_text.get_rect(center=(
                 self.display_surface.get_width() // 2 - 100,
                 self.display_surface.get_height() // 2 + 150
@@ -267,7 +260,7 @@ class SettingsPopup():
             self.music_toggle_rect = music_rect
             
             sfx_color = GREEN if self.sfx_enabled else RED
-            sfx_text = font.render("SFX: ON" if self.sfx_enabled else "SFX: OFF", True, sfx_color)
+            sfx_text = render_text(font, "SFX: ON" if self.sfx_enabled else "SFX: OFF", sfx_color)
             sfx_rect = sfx_text.get_rect(center=(
                 self.display_surface.get_width() // 2 + 100,
                 self.display_surface.get_height() // 2 + 150
@@ -281,4 +274,6 @@ class SettingsPopup():
             self.background()
             self.draw_sfx_controls()
             self.draw_music_controls()
-            self.draw_toggle_buttons()
\ No newline at end of file
+            self.draw_toggle_buttons()
+            return self.draw_rect
+        return None
\ No newline at end of file
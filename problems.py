@@ -0,0 +1,112 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:     # numpy is optional; batches are then built one problem at a time
+    np = None
+
+from settings import PROBLEM_PROFILES, PROBLEM_BATCH
+
+SYMBOLS = {"+": "+", "-": "-", "*": "×"}
+
+
+def profile_for(score, profiles=PROBLEM_PROFILES):
+    """Index of the difficulty profile used at score."""
+    for index, profile in enumerate(profiles):
+        if profile["max_score"] is None or score <= profile["max_score"]:
+            return index
+    return len(profiles) - 1
+
+
+def generate_batch(profile, count, spread=1, rng=None):
+    """
+    count problems for a difficulty profile, as arrays (a, b, op, answer).
+
+    op holds the operator characters. Subtraction always puts the larger
+    operand first, as generate_problem does. spread stretches the operand
+    range upwards to make room for more distinct answers.
+    """
+    low, high = profile["operands"]
+    high = low + (high - low) * spread
+    ops = profile["ops"]
+
+    if np is None:
+        rng = rng or random.Random()
+        a = [rng.randint(low, high) for _ in range(count)]
+        b = [rng.randint(low, high) for _ in range(count)]
+        op = [rng.choice(ops) for _ in range(count)]
+        for i in range(count):
+            if op[i] == "-" and a[i] < b[i]:
+                a[i], b[i] = b[i], a[i]
+        answer = [x * y if o == "*" else x - y if o == "-" else x + y for x, y, o in zip(a, b, op)]
+        return a, b, op, answer
+
+    rng = rng or np.random.default_rng()
+    a = rng.integers(low, high + 1, count)
+    b = rng.integers(low, high + 1, count)
+    op = np.array(list(ops))[rng.integers(0, len(ops), count)]
+    minus = op == "-"
+    a, b = np.where(minus, np.maximum(a, b), a), np.where(minus, np.minimum(a, b), b)
+    answer = np.where(op == "*", a * b, np.where(minus, a - b, a + b))
+    return a, b, op, answer
+
+
+class ProblemPool:
+    """
+    Problems for spawning enemies, generated a batch at a time per profile.
+
+    draw() hands out a problem whose answer no live enemy has, so a typed
+    answer always names one target; release() frees the answer again when
+    the enemy dies or leaves the screen. A draw pops problems off the pool
+    and drops those whose answer is live, so it costs a pop and a set lookup
+    per try rather than a scan, and only the problem handed out is ever
+    formatted. When a whole batch goes by without a free answer, e.g. with
+    hundreds of enemies on screen, the profile's operand range is stretched
+    until there is room, and it goes back to normal on reset().
+    """
+    def __init__(self, profiles=PROBLEM_PROFILES, batch=PROBLEM_BATCH, seed=None):
+        self.profiles = profiles
+        self.batch = batch
+        self.rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+        self.pools = [[] for _ in profiles]     # (answer, a, op, b), drawn from the end
+        self.spread = [1] * len(profiles)
+        self.live = set()
+        self.generated = 0
+
+    def _refill(self, index):
+        a, b, op, answer = generate_batch(self.profiles[index], self.batch, self.spread[index], self.rng)
+        if np is not None:
+            a, b, op, answer = a.tolist(), b.tolist(), op.tolist(), answer.tolist()
+        self.pools[index] = list(zip(answer, a, op, b))
+        self.generated += self.batch
+
+    def draw(self, score):
+        """A (question, answer) for score whose answer stays live until release(answer)."""
+        index = profile_for(score, self.profiles)
+        pool, live = self.pools[index], self.live
+        tries = 0
+        while True:
+            while pool:
+                answer, a, op, b = pool.pop()
+                if answer not in live:
+                    live.add(answer)
+                    return f"{a} {SYMBOLS[op]} {b}", answer
+                tries += 1
+
+            # A batch's worth of answers all taken: widen the range
+            if tries >= self.batch:
+                self.spread[index] *= 2
+                tries = 0
+            self._refill(index)
+            pool = self.pools[index]
+
+    def release(self, answer):
+        self.live.discard(answer)
+
+    def reset(self):
+        """Forget every live answer, e.g. for a new game, and undo any widening."""
+        self.live.clear()
+        for index, spread in enumerate(self.spread):
+            if spread != 1:
+                self.spread[index] = 1
+                self.pools[index].clear()
@@ -0,0 +1,131 @@
+import pygame, time, csv
+from array import array
+
+from settings import *
+from support import get_font, render_text
+
+PHASES = ("events", "update", "collide", "background", "draw", "hud", "present", "load", "idle")
+GRAPH_SIZE = (300, 80)
+GRAPH_MAX_MS = 50
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timings for Game.run, kept in fixed-size ring buffers.
+
+    Code under test calls lap(phase, start) with the perf_counter value it
+    started at and gets the current one back, so timing a phase costs one
+    clock read and one add. A phase can be lapped several times a frame,
+    e.g. "update" once per fixed step; the laps are summed. "collide" is
+    also counted within "update". "draw" covers enemies and sprites, "hud"
+    the score and lives layer, the input box and this overlay. Percentiles and the overlay are only
+    computed while the overlay is shown, and then only every
+    PROFILER_OVERLAY_REFRESH frames.
+    """
+    def __init__(self, capacity=PROFILER_HISTORY):
+        self.capacity = capacity
+        self.phases = {phase: array('d', bytes(8 * capacity)) for phase in PHASES}
+        self.totals = array('d', bytes(8 * capacity))
+        self.slot = 0
+        self.frames = 0
+        self.visible = False
+
+        self.overlay = None
+        self.overlay_age = 0
+        self.font = get_font(FONT, 14)
+
+    def lap(self, phase, start):
+        """Add the time since start to phase for this frame; returns the current time."""
+        now = time.perf_counter()
+        self.phases[phase][self.slot] += now - start
+        return now
+
+    def end_frame(self, frame_seconds):
+        """Record the whole frame's time and open the next slot."""
+        self.totals[self.slot] = frame_seconds
+        self.frames += 1
+        self.slot = self.frames % self.capacity
+        for samples in self.phases.values():
+            samples[self.slot] = 0.0
+        self.overlay_age += 1
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.overlay = None
+
+    def history(self, samples):
+        """A ring buffer's recorded values, oldest first."""
+        if self.frames < self.capacity:
+            return list(samples[:self.frames])
+        return list(samples[self.slot:]) + list(samples[:self.slot])
+
+    def summary(self):
+        """{phase: (p50, p95, p99)} in milliseconds, over the recorded history."""
+        result = {}
+        for phase, samples in (("frame", self.totals), *self.phases.items()):
+            values = sorted(self.history(samples))
+            result[phase] = tuple(percentile(values, p) * 1000 for p in (0.50, 0.95, 0.99))
+        return result
+
+    def dump_csv(self, path=None):
+        """Write every recorded frame to a CSV file; returns its path."""
+        path = path or time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        columns = [self.history(self.totals)] + [self.history(self.phases[phase]) for phase in PHASES]
+        first = max(0, self.frames - self.capacity)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "frame_ms"] + [f"{phase}_ms" for phase in PHASES])
+            for i, row in enumerate(zip(*columns)):
+                writer.writerow([first + i] + [f"{value * 1000:.3f}" for value in row])
+        return path
+
+    def _render_overlay(self):
+        summary = self.summary()
+        line_height = self.font.get_linesize()
+        width = GRAPH_SIZE[0] + 20
+        height = line_height * (len(summary) + 1) + GRAPH_SIZE[1] + 30
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        # Column by column, since the font is not monospaced; the numbers
+        # change every refresh, so they skip the shared text cache
+        columns = (10, 110, 170, 230)
+        y = 8
+        for x, heading in zip(columns, ("ms", "p50", "p95", "p99")):
+            overlay.blit(render_text(self.font, heading, GOLD), (x, y))
+        for phase, values in summary.items():
+            y += line_height
+            overlay.blit(render_text(self.font, phase, TEXT_COLOR), (columns[0], y))
+            for x, value in zip(columns[1:], values):
+                overlay.blit(self.font.render(f"{value:.2f}", True, TEXT_COLOR), (x, y))
+
+        # Frame-time graph, newest on the right, with 60 and 30 fps guides
+        graph = pygame.Rect(10, y + line_height + 12, *GRAPH_SIZE)
+        pygame.draw.rect(overlay, (255, 255, 255, 40), graph, 1)
+        for guide_ms, color in ((1000 / 60, GREEN), (1000 / 30, RED)):
+            guide_y = graph.bottom - int(guide_ms / GRAPH_MAX_MS * graph.height)
+            pygame.draw.line(overlay, color, (graph.left, guide_y), (graph.right - 1, guide_y))
+
+        totals = self.history(self.totals)[-graph.width:]
+        points = [(graph.right - len(totals) + i,
+                   graph.bottom - 1 - int(min(value * 1000, GRAPH_MAX_MS) / GRAPH_MAX_MS * (graph.height - 1)))
+                  for i, value in enumerate(totals)]
+        if len(points) > 1:
+            pygame.draw.lines(overlay, WHITE, False, points)
+        return overlay
+
+    def draw(self, screen):
+        """Blit the overlay in the top-right corner if it is shown; returns the rect drawn."""
+        if not self.visible:
+            return None
+        if self.overlay is None or self.overlay_age >= PROFILER_OVERLAY_REFRESH:
+            self.overlay = self._render_overlay()
+            self.overlay_age = 0
+        return screen.blit(self.overlay, self.overlay.get_rect(topright=(SCREEN_WIDTH - 10, 10)))
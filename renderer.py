@@ -0,0 +1,138 @@
+import pygame
+
+from settings import DIRTY_RENDERING, DIRTY_MAX_RECTS, DIRTY_MAX_AREA
+
+
+class DirtyRenderer:
+    """
+    Dirty-rectangle presenter for Game.run.
+
+    Each frame begin() erases what was drawn last frame by restoring the
+    background underneath it, everything drawn afterwards is reported with
+    mark(), and present() pushes only the erased and newly drawn regions
+    with pygame.display.update(rects). A new background frame, a change of
+    scene or invalidate() falls back to a full blit and display.flip().
+
+    So does a frame that marks more than max_rects rects or more than
+    max_area of the screen, e.g. a swarm of enemies: past that point one
+    full blit and flip costs less than restoring and pushing every rect.
+    """
+    def __init__(self, screen, enabled=DIRTY_RENDERING, max_rects=DIRTY_MAX_RECTS, max_area=DIRTY_MAX_AREA):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.enabled = enabled
+        self.max_rects = max_rects
+        self.max_area = max_area * self.screen_rect.w * self.screen_rect.h
+
+        self.previous = []      # drawn last frame, erased this frame
+        self.current = []
+        self.area = 0           # summed area of current
+        self.overflow = False   # too much marked this frame; present it whole
+        self.full = True
+        self.background = None
+        self.scene = None
+
+    def invalidate(self):
+        """Redraw and flip the whole screen on the next frame."""
+        self.full = True
+
+    def begin(self, background, scene=None, changed=None, full=False):
+        """
+        Start a frame over background.
+
+        changed lists background regions that were repainted in place since
+        the last frame (DeltaBackground.dirty_rects). Swapping to a different
+        background surface, e.g. an AnimatedBackground frame change, counts
+        as the whole screen changing, as does passing full=True.
+        """
+        if full or background is not self.background or scene != self.scene:
+            self.full = True
+        self.background = background
+        self.scene = scene
+
+        if self.full or not self.enabled:
+            self.full = True
+            self.screen.blit(background, (0, 0))
+            return
+
+        self.screen.blits([(background, rect, rect) for rect in self.previous], False)
+        if changed:
+            self.screen.blits([(background, rect, rect) for rect in changed], False)
+            self.mark_all(changed)
+
+    def mark(self, *rects):
+        """Record regions drawn this frame; None and empty rects are ignored."""
+        self.mark_all(rects)
+
+    def mark_all(self, rects):
+        if self.overflow:
+            return
+        # A swarm's worth of rects overflows anyway, so skip clipping them
+        if len(self.current) + len(rects) <= self.max_rects:
+            clip = self.screen_rect.clip
+            rects = [rect for rect in map(clip, filter(None, rects)) if rect]
+            self.current += rects
+            self.area += sum(rect.w * rect.h for rect in rects)
+            if self.area <= self.max_area:
+                return
+        self.overflow = True
+        self.current = []
+
+    def present(self):
+        if self.full or self.overflow:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.previous + self.current)
+
+        # After an overflow the rects to erase are unknown, so the next
+        # frame starts from a full blit
+        self.previous = self.current
+        self.current = []
+        self.area = 0
+        self.full = self.overflow
+        self.overflow = False
+
+
+# RenderQueue layers, drawn lowest first
+LAYER_SPRITES = 0
+LAYER_HUD = 1
+
+
+class RenderQueue:
+    """
+    Blits gathered over a frame and submitted with one Surface.blits call
+    per layer, lowest layer first; within a layer they keep the order they
+    were queued in. Anything wholly off-screen, such as enemies waiting
+    above the top edge, is dropped when it is queued.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.layers = {}
+
+    def __len__(self):
+        return sum(len(blits) for blits in self.layers.values())
+
+    def add(self, surface, dest, layer=LAYER_SPRITES):
+        """Queue surface at dest, a Rect or a topleft position."""
+        rect = dest if isinstance(dest, pygame.Rect) else surface.get_rect(topleft=dest)
+        if self.screen_rect.colliderect(rect):
+            self.layers.setdefault(layer, []).append((surface, rect))
+
+    def add_sprites(self, sprites, layer=LAYER_SPRITES):
+        """Queue each sprite's image at its rect, as Group.draw would draw them."""
+        visible = self.screen_rect.colliderect
+        blits = self.layers.setdefault(layer, [])
+        blits += [(sprite.image, sprite.rect) for sprite in sprites if visible(sprite.rect)]
+
+    def extend(self, blits, layer=LAYER_SPRITES):
+        """Queue (surface, dest) pairs the caller has already culled."""
+        self.layers.setdefault(layer, []).extend(blits)
+
+    def flush(self):
+        """Draw and forget everything queued; returns the rects drawn."""
+        rects = []
+        for layer in sorted(self.layers):
+            rects += self.screen.blits(self.layers[layer])
+        self.layers.clear()
+        return rects
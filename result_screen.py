@@ -0,0 +1,76 @@
+import pygame
+
+from support import load_font, render_text
+from settings import FONT, FONT_SIZE, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
+
+RESULT_SHADE = (0, 50, 0, 180)
+VICTORY_COLOR = (255, 255, 0)
+GAME_OVER_COLOR = (255, 0, 0)
+
+
+def compose_overlay(size, shade, lines):
+    """
+    A translucent shade with text on it, as one SRCALPHA surface.
+
+    lines holds (font, text, color, center) for each line of text.
+    """
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(shade)
+    for font, text, color, center in lines:
+        text_surf = render_text(font, text, color)
+        surface.blit(text_surf, text_surf.get_rect(center=center))
+    return surface
+
+
+class ResultScreen:
+    """
+    Game over, stage cleared or game cleared: the game, frozen as it was
+    when the screen came up, dimmed under a few lines of text.
+
+    Game.render draws the scene once more and hands it to freeze() before
+    anything such as the profiler overlay goes on top. From then on frame
+    is the renderer's background, so while it is up nothing is drawn or
+    presented again unless something else changes on top of it.
+    """
+    def __init__(self, lines, shade=RESULT_SHADE):
+        self.lines = lines
+        self.shade = shade
+        self.frame = None
+
+    def freeze(self, scene):
+        """Composite the overlay over a copy of scene; returns the frame."""
+        self.frame = scene.copy()
+        self.frame.blit(compose_overlay(self.frame.get_size(), self.shade, self.lines), (0, 0))
+        return self.frame
+
+
+def _lines(title, title_color, messages):
+    """Title and messages centred at the original screens' heights; messages are (text, offset)."""
+    font = load_font(FONT, FONT_SIZE)
+    x, y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+    lines = [(font['big'], title, title_color, (x, y - 60))]
+    lines += [(font['med'], text, WHITE, (x, y + offset)) for text, offset in messages]
+    return lines
+
+
+def game_over(score):
+    return ResultScreen(_lines("GAME OVER", GAME_OVER_COLOR, [
+        (f"Current Score: {score}", 0),
+        ("Press \"R\" to return to Menu!", 120),
+    ]))
+
+
+def stage_cleared(score):
+    return ResultScreen(_lines("VICTORY", VICTORY_COLOR, [
+        (f"Current Score: {score}", 0),
+        ("Press \"Enter\" to Next Stage!", 80),
+        ("Press \"R\" to return to Menu!", 120),
+    ]))
+
+
+def game_cleared(score):
+    return ResultScreen(_lines("VICTORY", VICTORY_COLOR, [
+        (f"Your Score: {score}", 0),
+        ("GAME CLEARED!", 40),
+        ("Press \"R\" to return to Menu!", 120),
+    ]))
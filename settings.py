@@ -3,7 +3,15 @@ import pygame
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 850
 SCREEN_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
-FPS = 60
+FPS = 60                # render cap; 0 renders as fast as possible
+VSYNC = False           # sync presents to the display instead of capping at FPS
+PRECISE_PACING = False  # busy-wait the last millisecond for steadier frame times
+SIM_HZ = 60             # fixed simulation steps per second
+MAX_CATCH_UP_STEPS = 5  # most simulation steps run for a single rendered frame
+# Speeds (enemy_speed, lasers, menu animation) are in pixels per frame of the
+# original loop, which ticked the clock twice and so ran at FPS / 2.
+SPEED_FRAME_RATE = 30
+STAR_SPEED = 3
 SPAWN_EVENT = pygame.USEREVENT + 1
 
 DARK_PURPLE = (29, 21, 46)
@@ -31,6 +39,20 @@ laser_sfx       = r'assets/sfx/sound effects/laser/laser-104024.mp3'
 hover_sfx = r'assets/sfx/sound effects/hoverbutton1.wav'
 victory_sfx = r'assets/sfx/sound effects/new level/game_win.mp3'
 
+# audio.SoundBank: mixer channels reserved for each category of effect
+SFX_CHANNELS = {"weapons": 3, "impacts": 4, "jingles": 2, "ui": 1}
+SFX_VOLUME = 0.5
+# name: (path, category, max voices at once, retrigger cooldown in ms, gain)
+SFX = {
+    'laser'    : (laser_sfx, "weapons", 3, 50, 1.0),
+    'explosion': (explosion_sfx, "impacts", 3, 30, 1.8),   # louder than score
+    'score'    : (score_sfx, "impacts", 1, 100, 1.0),
+    'newlevel' : (new_level_sfx, "jingles", 1, 500, 1.0),
+    'gameover' : (game_over_sfx, "jingles", 1, 500, 1.0),
+    'hover'    : (hover_sfx, "ui", 1, 60, 1.0),
+    'gamewin'  : (victory_sfx, "jingles", 1, 500, 1.0),
+}
+
 LIVES = 3
 
 player_folder_path = 'assets/entity/player/'
@@ -64,11 +86,80 @@ laser_filenames = [f"{laser_firing_folder_path}1.png",
                    f"{laser_travelling_folder_path}2.png",
                    ]
 
+play_button_path = 'assets/ui_ux/play_button'
 levels_filename = "levels.png"
 settings_filename = f"{settings_text_folder_path}settings.png"
 my_stats_filename = f"{mystats_text_folder_path}my_stats.png"
 quit_filename = f"{quit_text_folder_path}exit.png"
 
+mystats_number_path = 'assets/ui_ux/settings/number'
+mystats_text_path = 'assets/ui_ux/settings/text'
+
+# Sizes images are scaled to when loaded
+SPRITE_SIZE = (100, 100)
+PLAY_BUTTON_SIZE = (180, 120)
+LEVELS_BUTTON_SIZE = (180, 40)
+SETTINGS_BUTTON_SIZE = (320, 40)
+MY_STATS_BUTTON_SIZE = (320, 40)
+QUIT_BUTTON_SIZE = (140, 40)
+
+# Animated backgrounds
+GAME_BACKGROUND_PATH = 'assets/background/in_game/'
+GAME_BACKGROUND_FRAMES = 26
+MENU_BACKGROUND_PATH = 'assets/background/main/'
+MENU_BACKGROUND_FRAMES = 1
+
+# Stream the in-game background through a small ring buffer instead of
+# keeping all frames resident (each frame is ~2.7 MB at 800x850). An
+# explicit opt-in: it takes priority over the encoded loop below.
+BACKGROUND_STREAMING = False
+BACKGROUND_STREAM_MEMORY_CAP = 16 * 1024 * 1024     # bytes of decoded frames kept resident
+BACKGROUND_STREAM_PREFETCH = 3                      # frames decoded ahead of the current one
+
+# Keyframe + dirty-tile encoding of the in-game loop, built by frame_codec.py.
+# Used instead of the full frames whenever the folder holds an encoded loop.
+GAME_BACKGROUND_ENCODED_PATH = 'assets/background/in_game_encoded/'
+BACKGROUND_TILE_SIZE = 32
+
+# Only push the screen regions that changed instead of flipping every frame
+DIRTY_RENDERING = True
+DIRTY_MAX_RECTS = 300       # past this many rects, or this share of the
+DIRTY_MAX_AREA = 0.5        # screen, a frame is redrawn and flipped whole
+
+# Grid cell of the laser/enemy broadphase (collision.SpatialHash), about one sprite
+COLLISION_CELL_SIZE = 128
+
+# Rotated sprite frames are shared through an LRU cache, at angles snapped
+# to ROTATION_STEP degrees
+ROTATION_STEP = 5
+ROTATION_CACHE_BYTES = 16 * 1024 * 1024
+FRAME_SET_CACHE_BYTES = 8 * 1024 * 1024     # rescaled animations, e.g. Explosion
+TEXT_CACHE_BYTES = 4 * 1024 * 1024          # rendered text and labels (support.render_text)
+SCALE_CACHE_BYTES = 8 * 1024 * 1024         # UI sprites scaled by support.draw_ui_sprite
+LABELLED_CACHE_BYTES = 8 * 1024 * 1024      # enemy frames with their question baked in
+CACHE_REPORT = False                        # print cache hit/miss counts on quit
+
+# Asset loading
+ASSET_LOAD_WORKERS = None       # None picks one per CPU core (max 8)
+ASSET_LOAD_PROCESSES = False    # decode in a process pool instead of threads
+ASSET_LOAD_REPORT = False       # print the asset load summary and per-asset times at startup
+ASSET_CACHE_ENABLED = True      # keep converted, scaled pixels on disk between runs
+ASSET_CACHE_DIR = '.asset_cache'
+SOUND_CACHE_ENABLED = True      # keep sound effects decoded to raw PCM on disk between runs
+SOUND_CACHE_DIR = '.asset_cache/sound'
+STARTUP_LOAD_BUDGET_MS = 4      # per frame, for game scene images loading behind the menu
+
+# Player stats (stats_store.StatsStore), saved from a background thread in
+# batches every STATS_FLUSH_INTERVAL seconds; headless runs never save them
+STATS_PATH = 'save/stats.db'
+STATS_FLUSH_INTERVAL = 2.0
+
+# Frame-time profiler: F3 toggles the overlay, F4 dumps the history to CSV
+PROFILER_HISTORY = 600          # frames kept per phase
+PROFILER_OVERLAY_REFRESH = 15   # frames between overlay redraws
+PROFILER_KEY = pygame.K_F3
+PROFILER_DUMP_KEY = pygame.K_F4
+
 
 FONT = 'assets/fonts/minecraft.ttf'
 
@@ -78,6 +169,29 @@ FONT_SIZE = {
     'small' : 18
 }
 
+# Problem difficulty by score, matching generate_problem: the first profile
+# whose max_score is at least the score is used, the last one beyond that
+PROBLEM_PROFILES = [
+    {"max_score": 100, "ops": "+", "operands": (1, 10)},
+    {"max_score": 200, "ops": "+-", "operands": (1, 20)},
+    {"max_score": None, "ops": "+-*", "operands": (2, 12)},
+]
+PROBLEM_BATCH = 1024    # problems generated at once when a profile's pool runs low
+
+# Swarm mode (python main.py --mode swarm): an endless stream of enemies kept
+# in NumPy arrays (swarm.EnemySwarm), SWARM_SPAWN_BATCH every interval
+SWARM_SPAWN_INTERVAL = 250
+SWARM_SPAWN_BATCH = 4
+SWARM_ENEMY_SPEED = 1.5
+
+# Background starfield (starfield.Starfield), far to near: star count, speed
+# as a multiple of STAR_SPEED, size in pixels and colour
+STAR_LAYERS = [
+    (90, 0.4, 1, (110, 110, 140)),
+    (70, 1.0, 2, (200, 200, 220)),
+    (20, 1.8, 2, (255, 255, 255)),
+]
+
 # Stages
 DIFFICULTY_STAGES = [
     # Stage 1
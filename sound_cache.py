@@ -0,0 +1,87 @@
+import pygame, sys, mmap, struct
+
+from settings import *
+from blob_store import BlobStore, open_from_args
+
+# Blob layout: header (magic, frequency, sample format, channels) followed
+# by the raw PCM samples exactly as the mixer plays them.
+HEADER = struct.Struct("<4sIiI")
+MAGIC = b"PCM1"
+
+
+class SoundCache(BlobStore):
+    """
+    Directory of sound effects already decoded to the mixer's PCM format.
+
+    Each blob is keyed by the source path, its mtime and file size and the
+    mixer format (frequency, sample size, channels), so editing a sound or
+    opening the mixer differently simply misses the cache. Hits are
+    memory-mapped and handed to pygame.mixer.Sound(buffer=...), which skips
+    the MP3/WAV decoder entirely.
+    """
+    kind = "sound cache"
+    extension = ".pcm"
+
+    def __init__(self, directory=SOUND_CACHE_DIR):
+        super().__init__(directory)
+
+    def blob_path(self, path):
+        return self._blob_path(path, pygame.mixer.get_init())
+
+    def get(self, path):
+        """Returns the cached Sound, or None on a miss. Needs an initialised mixer."""
+        blob = self._find(path)
+        if blob is None:
+            return None
+
+        try:
+            with open(blob, "rb") as f:
+                mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                magic, frequency, size, channels = HEADER.unpack_from(mapping)
+                if magic != MAGIC or (frequency, size, channels) != pygame.mixer.get_init():
+                    raise ValueError("foreign blob")
+                # Sound copies the samples into the mixer, so the mapping
+                # can go as soon as it is built
+                with memoryview(mapping) as view:
+                    sound = pygame.mixer.Sound(buffer=view[HEADER.size:])
+            finally:
+                mapping.close()
+        except (OSError, ValueError, struct.error, pygame.error):
+            self.misses += 1
+            return None
+
+        self._hit(blob)
+        return sound
+
+    def put(self, path, sound):
+        """Store a decoded Sound."""
+        blob = self.blob_path(path)
+        if blob is not None:
+            self._write(blob, HEADER.pack(MAGIC, *pygame.mixer.get_init()), sound.get_raw())
+
+
+def main(argv=None):
+    """Decode every sound effect once, e.g. at install time: python sound_cache.py"""
+    cache = open_from_args(SoundCache, "Build the ArithMetron sound effect cache.", SOUND_CACHE_DIR, argv)
+    if cache is None:
+        return 0
+
+    # The key includes the mixer format, so warm it with the game's defaults
+    try:
+        pygame.mixer.init()
+    except pygame.error as e:
+        print(f"Warning: No audio device, nothing to cache: {e}")
+        return 1
+
+    import audio
+    for path, *_ in SFX.values():
+        audio.load_sound(path, cache)
+
+    print(f"{cache.hits} already cached, {cache.misses} decoded into {cache.directory}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import random
+import pygame
+
+try:
+    import numpy as np
+except ImportError:     # numpy is optional; stars are then kept in lists and drawn one fill at a time
+    np = None
+
+from settings import STAR_LAYERS, STAR_SPEED, SPEED_FRAME_RATE
+
+
+class StarLayer:
+    """One parallax layer: stars of the same size and colour falling at the same speed."""
+    def __init__(self, width, height, count, speed, size, colour):
+        self.speed = speed      # pixels per frame at SPEED_FRAME_RATE
+        self.size = size
+        self.colour = colour
+        x = [random.randrange(width - size + 1) for _ in range(count)]
+        y = [random.uniform(0, height) for _ in range(count)]
+        if np is not None:
+            x, y = np.array(x, dtype=np.intp), np.array(y)
+        self.x = x
+        self.y = y
+
+
+class Starfield:
+    """
+    Falling background stars in parallax layers (STAR_LAYERS).
+
+    With numpy every layer is a pair of arrays: update() moves them with one
+    array operation and draw() writes the stars straight into the target's
+    pixels through surfarray.pixels2d, so thousands of stars cost about as
+    much as a hundred did with a draw.rect call each. Without numpy, or on
+    a surface that is not 32-bit, stars are filled one by one.
+    """
+    def __init__(self, size, layers=STAR_LAYERS, speed=STAR_SPEED):
+        self.width, self.height = size
+        self.layers = [StarLayer(self.width, self.height, count, speed * factor, star_size, colour)
+                       for count, factor, star_size, colour in layers]
+
+    def __len__(self):
+        return sum(len(layer.x) for layer in self.layers)
+
+    def update(self, dt):
+        for layer in self.layers:
+            dy = layer.speed * SPEED_FRAME_RATE * dt / 1000
+            if np is not None:
+                layer.y += dy
+                np.mod(layer.y, self.height, out=layer.y)
+            else:
+                layer.y = [(y + dy) % self.height for y in layer.y]
+
+    def draw(self, surface):
+        """Draw every star onto surface; returns the rects drawn."""
+        if np is None or surface.get_bytesize() != 4:
+            return self._fill(surface)
+
+        rects = []
+        pixels = pygame.surfarray.pixels2d(surface)
+        try:
+            for layer in self.layers:
+                size = layer.size
+                colour = surface.map_rgb(layer.colour)
+                # Keep the whole star on screen, as the rect fill would clip it
+                y = np.minimum(layer.y.astype(np.intp), self.height - size)
+                for dx in range(size):
+                    for dy in range(size):
+                        pixels[layer.x + dx, y + dy] = colour
+                rects += [(x, top, size, size) for x, top in zip(layer.x.tolist(), y.tolist())]
+        finally:
+            # The surface stays locked while the pixel array is alive
+            del pixels
+        return rects
+
+    def _fill(self, surface):
+        rects = []
+        for layer in self.layers:
+            size = layer.size
+            for x, y in zip(layer.x, layer.y):
+                rects.append(surface.fill(layer.colour, (x, min(int(y), self.height - size), size, size)))
+        return rects
@@ -0,0 +1,116 @@
+import os, sqlite3, threading
+
+from settings import STATS_PATH, STATS_FLUSH_INTERVAL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    highest_level INTEGER NOT NULL,
+    annihilated INTEGER NOT NULL
+)
+"""
+
+
+class StatsStore:
+    """
+    The player's stats in a one-row SQLite table, written behind the game.
+
+    record() only folds a change into the pending batch under a lock, so the
+    frame loop never touches the disk. A daemon thread commits whatever is
+    pending every flush_interval seconds as one transaction, and close()
+    commits the last batch. SQLite makes every batch all-or-nothing, so a
+    crash loses at most the last interval and never corrupts the file;
+    loading is a single-row select however long the game has been played.
+    """
+    def __init__(self, path=STATS_PATH, flush_interval=STATS_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.highest_level = 1
+        self.annihilated = 0
+        self.commits = 0
+
+        self.pending_level = 0
+        self.pending_annihilated = 0
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = None
+
+        try:
+            connection = self._connect()
+            try:
+                self.highest_level, self.annihilated = connection.execute(
+                    "SELECT highest_level, annihilated FROM stats WHERE id = 1").fetchone()
+            finally:
+                connection.close()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open stats {self.path}, they will not be saved: {e}")
+            return
+
+        self.thread = threading.Thread(target=self._write_behind, name="stats-writer", daemon=True)
+        self.thread.start()
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        # WAL commits append to a log instead of rewriting pages in place
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            connection.execute(SCHEMA)
+            connection.execute("INSERT OR IGNORE INTO stats VALUES (1, 1, 0)")
+        return connection
+
+    def record(self, highest_level, annihilated=0):
+        """Queue a level reached and a number of enemies destroyed; never blocks on I/O."""
+        with self.condition:
+            self.pending_level = max(self.pending_level, highest_level)
+            self.pending_annihilated += annihilated
+
+    def _take_pending(self):
+        batch = (self.pending_level, self.pending_annihilated)
+        self.pending_level = self.pending_annihilated = 0
+        return batch
+
+    def _write_behind(self):
+        try:
+            connection = self._connect()
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not open stats {self.path}, they will not be saved: {e}")
+            return
+        try:
+            while True:
+                with self.condition:
+                    if self.running:
+                        self.condition.wait(self.flush_interval)
+                    running = self.running
+                    level, annihilated = self._take_pending()
+
+                if level or annihilated:
+                    try:
+                        with connection:
+                            connection.execute("UPDATE stats SET highest_level = MAX(highest_level, ?), "
+                                               "annihilated = annihilated + ? WHERE id = 1", (level, annihilated))
+                        self.commits += 1
+                    except sqlite3.Error as e:
+                        print(f"Warning: Could not save stats to {self.path}: {e}")
+                        # Keep the batch for the next attempt
+                        self.record(level, annihilated)
+                        if not running:
+                            return
+
+                if not running:
+                    return
+        finally:
+            connection.close()
+
+    def close(self):
+        """Commit anything still pending and stop the writer."""
+        if self.thread is None:
+            return
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join()
+        self.thread = None
@@ -1,6 +1,21 @@
 import pygame as py, os, random
+import asset_loader
+from settings import TEXT_CACHE_BYTES
+from transform_cache import SurfaceCache, scaled
+
+# Every font the game uses, loaded once, keyed by (file, size)
+_fonts = {}
+# Rendered text, keyed by (font, text, colour, antialias, box)
+text_cache = SurfaceCache(TEXT_CACHE_BYTES)
 
 def load_image(path, colorkey=None):
+    preloaded = asset_loader.get(path)
+    if preloaded is not None:
+        if colorkey is not None:
+            preloaded = preloaded.copy()
+            preloaded.set_colorkey(colorkey)
+        return preloaded
+
     try:
         image = py.image.load(path)
         image = image.convert_alpha() if image.get_alpha() else image.convert()
@@ -27,29 +42,47 @@ def load_images_from_folder(folder, colorkey=None):
 def surface_blit(surface, pos=(0, 0)):
     display_surface = py.display.get_surface()
 
-    display_surface.blit(surface, pos)
+    return display_surface.blit(surface, pos)
+
+def get_font(font, size):
+    """Returns the shared Font for a font file (None for pygame's default) at size."""
+    key = (font, size)
+    if key not in _fonts:
+        if not py.font.get_init():
+            py.font.init()
+        _fonts[key] = py.font.Font(font, size)
+    return _fonts[key]
 
 def load_font(font, font_size):
     fonts = {}
 
     for size_key, size in font_size.items():
-        fonts[size_key] = py.font.Font(font, size)
+        fonts[size_key] = get_font(font, size)
 
     return fonts
 
-def overlay(size, color, alpha, pos=None):
-    overlay = py.Surface(size, py.SRCALPHA)
-    overlay.fill(color)
-    overlay.set_alpha(alpha)
-
-    if pos is None:
-        pos = (0, 0)
+def render_text(font, text, color, antialias=True, box=None):
+    """
+    Returns font.render(text, antialias, color) from the shared text cache.
 
-    surface_blit(overlay, pos)
+    box=(padding, rgba) composites the text onto a translucent backing box
+    padded on every side, so a label is a single cached surface.
+    """
+    key = (id(font), text, tuple(color), antialias, box)
+    surface = text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, antialias, color)
+        if box is not None:
+            padding, fill = box
+            boxed = py.Surface((surface.get_width() + padding * 2, surface.get_height() + padding * 2), py.SRCALPHA)
+            boxed.fill(fill)
+            boxed.blit(surface, (padding, padding))
+            surface = boxed
+        text_cache.put(key, surface, (font,))
+    return surface
 
 def display_text(display, font, text, color, center=None):
-    fonts = font
-    text_surf = fonts.render(text, True, color)
+    text_surf = render_text(font, text, color)
 
     if center is None:
         center = (display[0] // 2, display[1] // 2)
@@ -59,25 +92,11 @@ def display_text(display, font, text, color, center=None):
 
     return text_rect
 
-def draw_stars(display, stars, height):
-
-    new_stars = [(x, (y + 3) % height) for (x, y) in stars]
-
-    for (x, y) in new_stars:
-        py.draw.rect(display, (200, 200, 220), (x, y, 2, 2))
-    return new_stars
-
-def get_master_sfx_volume() -> float:
-    """
-    Returns the current SFX volume (0.0 – 1.0) as set in SettingsPopup.
-    """
-    import __main__   # simple way to reach the running Game instance
-    return __main__.game.settings_popup.sfx_volume
-
 def draw_ui_sprite(surface, size, position, anchor_point):
     if surface:
-        scaled = py.transform.scale(surface, size)
-        rect = scaled.get_rect(**{anchor_point: position})
-        surface_blit(scaled, rect)
+        # Popups redraw the same sprites at the same sizes every frame
+        sprite = scaled(surface, size)
+        rect = sprite.get_rect(**{anchor_point: position})
+        surface_blit(sprite, rect)
         return True
     return False
\ No newline at end of file
@@ -0,0 +1,155 @@
+try:
+    import numpy as np
+except ImportError:     # swarm mode needs numpy; Game falls back to the classic mode without it
+    np = None
+
+from settings import SPEED_FRAME_RATE, TEXT_COLOR, SCREEN_HEIGHT
+from renderer import LAYER_SPRITES
+from transform_cache import labelled
+
+
+class EnemySwarm:
+    """
+    Every enemy of the swarm mode as rows of NumPy arrays.
+
+    Live enemies are the first count rows; removing one moves the last row
+    into its place. Movement, animation, the loss line and laser hits are
+    each a handful of array operations over all enemies, and draw() culls
+    and queues every enemy for the frame's RenderQueue at once, one blit
+    each. The only per-enemy Python objects are its animation frames with
+    the question baked in, shared through transform_cache.labelled.
+    """
+    def __init__(self, frames, font, capacity=1024, animation_speed=100):
+        self.frames = frames
+        self.font = font
+        self.animation_speed = animation_speed
+        self.size = np.array(frames[0].get_size(), dtype=np.float64)
+        self.count = 0
+
+        self.pos = np.zeros((capacity, 2))
+        self.prev_y = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.phase = np.zeros(capacity)     # ms into the animation
+        self.answer = np.zeros(capacity, dtype=np.int64)
+        self.half = np.zeros((capacity, 2), dtype=np.int64)    # half the size of the labelled frames
+        self.sprites = [None] * capacity
+        self.questions = [None] * capacity
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        capacity = len(self.speed) * 2
+        for name in ("pos", "prev_y", "speed", "phase", "answer", "half"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.sprites += [None] * (capacity - len(self.sprites))
+        self.questions += [None] * (capacity - len(self.questions))
+
+    def spawn(self, x, y, speed, problem):
+        if self.count == len(self.speed):
+            self._grow()
+        i = self.count
+        question, answer = problem
+        self.pos[i] = (x, y)
+        self.prev_y[i] = y
+        self.speed[i] = speed
+        self.phase[i] = 0
+        self.answer[i] = answer
+        self.questions[i] = question
+        self.sprites[i] = [labelled(frame, self.font, question, TEXT_COLOR, box=(5, (0, 0, 0, 150)))
+                           for frame in self.frames]
+        self.half[i] = (self.sprites[i][0].get_width() // 2, self.sprites[i][0].get_height() // 2)
+        self.count += 1
+
+    def remove(self, indices):
+        """Drop the enemies at indices; returns their answers."""
+        indices = sorted(set(int(i) for i in indices), reverse=True)
+        answers = [int(self.answer[i]) for i in indices]
+        # Highest first, so a row moved down from the end is never one still to remove
+        for i in indices:
+            last = self.count - 1
+            if i != last:
+                self.pos[i] = self.pos[last]
+                self.prev_y[i] = self.prev_y[last]
+                self.speed[i] = self.speed[last]
+                self.phase[i] = self.phase[last]
+                self.answer[i] = self.answer[last]
+                self.half[i] = self.half[last]
+                self.sprites[i] = self.sprites[last]
+                self.questions[i] = self.questions[last]
+            self.sprites[last] = self.questions[last] = None
+            self.count = last
+        return answers
+
+    def clear(self):
+        self.remove(range(self.count))
+
+    def update(self, dt):
+        n = self.count
+        self.prev_y[:n] = self.pos[:n, 1]
+        self.pos[:n, 1] += self.speed[:n] * (SPEED_FRAME_RATE * dt / 1000)
+        self.phase[:n] += dt
+
+    def crossed(self, bottom):
+        """Indices of enemies whose bottom edge reaches bottom or further."""
+        n = self.count
+        return np.flatnonzero(self.pos[:n, 1] + self.size[1] / 2 >= bottom)
+
+    def lowest(self, answer=None):
+        """Index of the lowest enemy with answer (any answer if None), or None."""
+        n = self.count
+        if answer is None:
+            return int(np.argmax(self.pos[:n, 1])) if n else None
+        matches = np.flatnonzero(self.answer[:n] == answer)
+        if not len(matches):
+            return None
+        return int(matches[np.argmax(self.pos[matches, 1])])
+
+    def center(self, i):
+        return (float(self.pos[i, 0]), float(self.pos[i, 1]))
+
+    def collide(self, lasers):
+        """
+        {laser: [indices hit]} for lasers whose rect overlaps an enemy's.
+        An enemy is only counted for the first laser that hits it.
+        """
+        n = self.count
+        if not n or not lasers:
+            return {}
+        half = self.size / 2
+        x, y = self.pos[:n, 0], self.pos[:n, 1]
+        taken = np.zeros(n, dtype=bool)
+        hits = {}
+        for laser in lasers:
+            rect = laser.rect
+            overlap = ((x + half[0] > rect.left) & (x - half[0] < rect.right) &
+                       (y + half[1] > rect.top) & (y - half[1] < rect.bottom) & ~taken)
+            indices = np.flatnonzero(overlap)
+            if len(indices):
+                taken[indices] = True
+                hits[laser] = indices.tolist()
+        return hits
+
+    def draw(self, queue, alpha=1):
+        """Queue every enemy on screen on queue, a renderer.RenderQueue."""
+        n = self.count
+        if not n:
+            return
+        y = self.prev_y[:n] + (self.pos[:n, 1] - self.prev_y[:n]) * alpha
+        half_height = self.size[1] / 2
+        # Enemies spawn above the top edge and are removed at the loss line,
+        # so only the vertical extent needs culling
+        visible = np.flatnonzero((y + half_height > 0) & (y - half_height < SCREEN_HEIGHT))
+        if not len(visible):
+            return
+        half = self.half[visible]
+        left = (self.pos[visible, 0].round().astype(np.int64) - half[:, 0]).tolist()
+        top = (y[visible].round().astype(np.int64) - half[:, 1]).tolist()
+        frame_index = ((self.phase[visible] // self.animation_speed) % len(self.frames)).astype(int).tolist()
+
+        sprites = self.sprites
+        queue.extend([(sprites[i][f], (lx, ty)) for i, f, lx, ty in zip(visible.tolist(), frame_index, left, top)],
+                     LAYER_SPRITES)
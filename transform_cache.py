@@ -0,0 +1,168 @@
+import pygame
+from collections import OrderedDict
+
+from settings import ROTATION_STEP, ROTATION_CACHE_BYTES, FRAME_SET_CACHE_BYTES, SCALE_CACHE_BYTES, LABELLED_CACHE_BYTES
+
+
+def surface_bytes(surface):
+    """Pixel memory of a surface, or of every surface in a frame list."""
+    if isinstance(surface, (list, tuple)):
+        return sum(surface_bytes(frame) for frame in surface)
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class SurfaceCache:
+    """
+    LRU cache of derived surfaces, capped by the pixel memory they hold.
+
+    Entries keep a reference to the surfaces their key was built from, so a
+    key made with id(source) can never be reused by a different surface
+    while the entry is alive.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()    # key -> (surface, sources)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surface, sources=()):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= surface_bytes(old[0])
+
+        self.entries[key] = (surface, sources)
+        self.bytes += surface_bytes(surface)
+
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.bytes -= surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        return {"entries": len(self.entries), "bytes": self.bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+rotation_cache = SurfaceCache(ROTATION_CACHE_BYTES)
+frame_set_cache = SurfaceCache(FRAME_SET_CACHE_BYTES)
+scale_cache = SurfaceCache(SCALE_CACHE_BYTES)
+labelled_cache = SurfaceCache(LABELLED_CACHE_BYTES)
+
+
+def quantize_angle(angle, step=ROTATION_STEP):
+    """Snap an angle in degrees to the nearest multiple of step, in [0, 360)."""
+    return (round(angle / step) * step) % 360
+
+
+def rotated(frame, angle):
+    """frame rotated by angle (snapped to ROTATION_STEP), shared process-wide."""
+    angle = quantize_angle(angle)
+    if angle == 0:
+        return frame
+
+    key = (id(frame), angle)
+    surface = rotation_cache.get(key)
+    if surface is None:
+        surface = rotation_cache.put(key, pygame.transform.rotate(frame, angle), (frame,))
+    return surface
+
+
+def scaled_frames(frames, scale):
+    """
+    Every frame of an animation scaled by a factor, shared process-wide.
+
+    Keyed by the identity of the source frames, so spawning the same
+    animation again costs no transforms. Returns a list the caller must
+    not modify.
+    """
+    if not frames:
+        return []
+
+    key = (tuple(id(frame) for frame in frames), scale)
+    scaled = frame_set_cache.get(key)
+    if scaled is None:
+        scaled = [pygame.transform.scale(frame, (int(frame.get_width() * scale), int(frame.get_height() * scale)))
+                  for frame in frames]
+        frame_set_cache.put(key, scaled, tuple(frames))
+    return scaled
+
+
+def scaled(surface, size):
+    """surface scaled to size, shared process-wide; the source itself if it already is that size."""
+    size = tuple(size)
+    if surface.get_size() == size:
+        return surface
+
+    key = (id(surface), size)
+    result = scale_cache.get(key)
+    if result is None:
+        result = scale_cache.put(key, pygame.transform.scale(surface, size), (surface,))
+    return result
+
+
+def labelled(frame, font, text, color, box=None):
+    """
+    frame with text, as support.render_text renders it, composited over
+    its centre; shared process-wide.
+
+    The result is large enough for both, so a label wider than the frame
+    is not cut off. Enemies with the same question share one surface per
+    animation frame and are drawn with a single blit. Keyed by the text
+    rather than the rendered label, which the text cache may evict and
+    render again as a different surface.
+    """
+    key = (id(frame), text, id(font), tuple(color), box)
+    surface = labelled_cache.get(key)
+    if surface is None:
+        from support import render_text
+        label = render_text(font, text, color, box=box)
+        width = max(frame.get_width(), label.get_width())
+        height = max(frame.get_height(), label.get_height())
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        centre = (width // 2, height // 2)
+        surface.blit(frame, frame.get_rect(center=centre))
+        surface.blit(label, label.get_rect(center=centre))
+        # Composites are never drawn on, and run-length encoding lets a blit
+        # skip their transparent pixels: about four times faster per enemy
+        surface.set_alpha(255, pygame.RLEACCEL)
+        labelled_cache.put(key, surface, (frame, font))
+    return surface
+
+
+def report():
+    """Hit, miss and memory figures for every shared cache, as printable lines."""
+    caches = {"rotation": rotation_cache, "frame sets": frame_set_cache, "scaled": scale_cache,
+              "labelled": labelled_cache}
+    try:
+        from support import text_cache
+        caches["text"] = text_cache
+    except ImportError:
+        pass
+
+    lines = []
+    for name, cache in caches.items():
+        stats = cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups * 100 if lookups else 0
+        lines.append(f"{name:>10}: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.1f}%), "
+                     f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KB, {stats['evictions']} evicted")
+    return lines
@@ -45,7 +45,7 @@ class UI():
         else:
             self.dash_sprite = None
     
-    def draw_stage_info(self, stage_number):
+    def stage_info_blits(self, stage_number):
         stage_str = str(stage_number)
         
         total_width = 0
@@ -55,20 +55,25 @@ class UI():
         
         pos_x = 0
         pos_y = self.display_surface.get_height() - max(self.stage_size[1], self.number_size[1])
+        blits = []
         
         if self.stage_text:
-            self.display_surface.blit(self.stage_text, (pos_x, pos_y))
+            blits.append((self.stage_text, (pos_x, pos_y)))
             pos_x += self.stage_size[0] + 10
         
         if self.dash_size:
-            self.display_surface.blit(self.dash_sprite, (pos_x - 35, pos_y + 10))
+            blits.append((self.dash_sprite, (pos_x - 35, pos_y + 10)))
 
         for digit in stage_str:
             if digit in self.number_sprites and self.number_sprites[digit]:
-                self.display_surface.blit(self.number_sprites[digit], (pos_x, pos_y + 10))
+                blits.append((self.number_sprites[digit], (pos_x, pos_y + 10)))
                 pos_x += self.number_size[0] + 5
+        return blits
+
+    def draw_stage_info(self, stage_number):
+        return self.display_surface.blits(self.stage_info_blits(stage_number))
     
-    def draw_lives(self,):
+    def lives_blits(self):
         x = self.display_surface.get_width()
         y = self.display_surface.get_height()
 
@@ -76,9 +81,13 @@ class UI():
         y = y - self.lives_sprite_size[1] - 70
         lives_key = str(self.lives)
         if lives_key in self.lives_sprites and self.lives_sprites[lives_key]:
-            self.display_surface.blit(self.lives_sprites[lives_key], (x, y))
+            return [(self.lives_sprites[lives_key], (x, y))]
+        return []
+
+    def draw_lives(self):
+        return self.display_surface.blits(self.lives_blits())
     
-    def draw_score(self, score):
+    def score_blits(self, score):
         score_str = str(score)
         total_width = len(score_str) * (self.number_size[0] + 2) - 2
         pos_x = self.display_surface.get_width() - 10
@@ -86,6 +95,7 @@ class UI():
         
         # Calculate the starting x position for the rightmost digit
         start_x = pos_x
+        blits = []
         
         for digit in score_str[::-1]: # Iterate over the string in reverse
             if digit in self.number_sprites and self.number_sprites[digit]:
@@ -94,10 +104,14 @@ class UI():
                 
                 # Position the current digit
                 sprite_rect.topright = (start_x, pos_y)
-                self.display_surface.blit(sprite, sprite_rect)
+                blits.append((sprite, sprite_rect))
                 
                 # Move the starting position to the left for the next digit
                 start_x -= self.number_size[0] + 2
+        return blits
+
+    def draw_score(self, score):
+        return self.display_surface.blits(self.score_blits(score))
         
     def draw_dash(self, x, y):
         if self.dash_sprite:
@@ -114,7 +128,10 @@ class UI():
     def reset_lives(self):
         self.lives = LIVES
     
+    def blits(self, stage_number=0, score=0):
+        """Every (surface, position) the HUD draws, for Surface.blits or a RenderQueue."""
+        return self.stage_info_blits(stage_number) + self.lives_blits() + self.score_blits(score)
+
     def display(self, stage_number=0, score=0):
-        self.draw_stage_info(stage_number)
-        self.draw_lives()
-        self.draw_score(score)
\ No newline at end of file
+        """Draws the HUD and returns the rects it covered."""
+        return self.display_surface.blits(self.blits(stage_number, score))
\ No newline at end of file